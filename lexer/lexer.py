@@ -1,15 +1,15 @@
 import ply.lex as lex
-import sys
+import re
 import os
+import sys
+from collections import namedtuple
 
 # -----------------------------------------------------------------------------
-# IMPORTAÇÃO COM FALLBACK
+# IMPORTAÇÃO
 # -----------------------------------------------------------------------------
-try:
-    from .tokens import tokens, reserved
-except ImportError:
-    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from tokens import tokens, reserved
+# Import relativo único: sem mutação de sys.path no import (que forçava um
+# rescan de todos os diretórios do path) nem tentativas de fallback.
+from .tokens import tokens, reserved
 
 # -----------------------------------------------------------------------------
 # SÍMBOLOS ESPECIAIS
@@ -48,29 +48,37 @@ t_ignore_comment = r"//.*"
 
 
 # Comentário multilinha /* ... */
+# Varredura linear: a alternação aninhada original forçava o motor de regex
+# a backtracking; str.find/str.count fazem o salto até '*/' em nível C, O(n).
 def t_comment_block(t):
-    r"/\*([^*]|\*+[^*/])*\*/"
-    pass
+    r"/\*"
+    lexdata = t.lexer.lexdata
+    end = lexdata.find("*/", t.lexer.lexpos)
+    if end < 0:
+        print(
+            f"Erro Léxico: Comentário de bloco não terminado na linha {t.lexer.lineno}"
+        )
+        t.lexer.lexpos = len(lexdata)
+        return
+    t.lexer.lineno += lexdata.count("\n", t.lexer.lexpos, end)
+    t.lexer.lexpos = end + 2
 
 
 # -----------------------------------------------------------------------------
 # LITERAIS
 # -----------------------------------------------------------------------------
-def t_DATETIME_LITERAL(t):
-    r"'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'"
-    t.value = t.value[1:-1]
-    return t
-
-
-def t_DATE_LITERAL(t):
-    r"'\d{4}-\d{2}-\d{2}'"
-    t.value = t.value[1:-1]
-    return t
-
-
-def t_TIME_LITERAL(t):
-    r"'\d{2}:\d{2}:\d{2}'"
-    t.value = t.value[1:-1]
+# Regra combinada: uma única alternação cobre DATE, TIME e DATETIME,
+# reduzindo em dois ramos a regex mestre do PLY; o callback decide o tipo.
+def t_TEMPORAL_LITERAL(t):
+    r"'(?:\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2})?|\d{2}:\d{2}:\d{2})'"
+    s = t.value[1:-1]
+    if "T" in s:
+        t.type = "DATETIME_LITERAL"
+    elif "-" in s:
+        t.type = "DATE_LITERAL"
+    else:
+        t.type = "TIME_LITERAL"
+    t.value = s
     return t
 
 
@@ -89,31 +97,62 @@ def t_STRING(t):
 # -----------------------------------------------------------------------------
 # IDENTIFICADORES (ID ÚNICO)
 # -----------------------------------------------------------------------------
-def t_ID(t):
-    r"[a-zA-Z][a-zA-Z0-9_\-\.]*"
+# Método .get ligado uma vez: evita LOAD_GLOBAL + dois lookups por identificador
+reserved_get = reserved.get
 
-    # 1. Palavra reservada
-    if t.value in reserved:
-        t.type = reserved[t.value]
-        return t
+# Tabelas de 256 entradas indexadas por código do caractere: a classificação
+# do primeiro/último caractere vira um acesso a bytes em nível C, sem o
+# despacho de método de str.islower()/str.isdigit() por identificador.
+_FIRST_IS_LOWER = bytes(1 if chr(i).islower() else 0 for i in range(256))
+_LAST_IS_DIGIT = bytes(1 if chr(i).isdigit() else 0 for i in range(256))
+
+
+# A classificação é uma função pura do lexema e os nomes se repetem dezenas
+# de vezes num mesmo fonte: o resultado é memoizado por lexema, limitado
+# naturalmente pelo tamanho do vocabulário.
+_ID_CACHE = {}
+
+
+def _classify_id(value):
+    # 1. Palavra reservada (um único lookup no dict de chaves internadas)
+    tok_type = reserved_get(value)
+    if tok_type is not None:
+        return tok_type
 
     # 2. NOVO DATATYPE
-    if t.value.endswith("DataType"):
-        t.type = "NEW_DATATYPE"
-        return t
+    # O teste de um único caractere filtra quase todos os identificadores
+    # antes do despacho de método do endswith
+    if len(value) >= 8 and value[-8] == "D" and value.endswith("DataType"):
+        return "NEW_DATATYPE"
 
     # 3. INSTANCE
-    if t.value[-1].isdigit():
-        t.type = "INSTANCE_NAME"
-        return t
+    if _LAST_IS_DIGIT[ord(value[-1])]:
+        return "INSTANCE_NAME"
 
     # 4. RELATION_NAME
-    if t.value[0].islower():
-        t.type = "RELATION_NAME"
-        return t
+    if _FIRST_IS_LOWER[ord(value[0])]:
+        return "RELATION_NAME"
 
     # 5. CLASS_NAME
-    t.type = "CLASS_NAME"
+    return "CLASS_NAME"
+
+
+def classify_id(value):
+    """Classifica um identificador (mesma lógica de t_ID), com memoização."""
+    typ = _ID_CACHE.get(value)
+    if typ is None:
+        typ = _ID_CACHE[value] = _classify_id(value)
+    return typ
+
+
+def t_ID(t):
+    r"[a-zA-Z][a-zA-Z0-9_\-\.]*"
+    # Internar o lexema faz estereótipos ("kind", "disjoint", ...) e nomes
+    # repetidos compartilharem o mesmo objeto str: comparações e lookups de
+    # dict na análise semântica viram checagens de identidade (ponteiro),
+    # em vez de comparar caractere a caractere.
+    t.value = sys.intern(t.value)
+    t.type = classify_id(t.value)
     return t
 
 
@@ -133,7 +172,111 @@ def t_error(t):
 # -----------------------------------------------------------------------------
 # CRIAR LEXER
 # -----------------------------------------------------------------------------
-lexer = lex.lex()
+# optimize=1 grava as tabelas em lexer_lextab.py (como o parsetab.py do
+# parser) e as reutiliza nas próximas execuções, pulando o re.compile de
+# cada regra t_* e a introspecção do módulo a cada import.
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+lexer = lex.lex(optimize=1, lextab="lexer.lexer_lextab", outputdir=_current_dir)
+
+
+# -----------------------------------------------------------------------------
+# TOKENIZADOR RÁPIDO (REGEX MESTRE)
+# -----------------------------------------------------------------------------
+# O PLY despacha cada token por chamadas de função Python (uma por regra).
+# Para o caminho quente de análise léxica pura, uma única alternação com
+# grupos nomeados percorre a entrada inteira em nível C via finditer(),
+# despachando apenas em m.lastgroup.
+#
+# Um scanner compilado (Cython/Numba) daria mais bytes/ciclo em arquivos
+# .tonto de vários MB, mas exigiria toolchain de build e dependências novas
+# num projeto que é Python puro + PLY; a regex mestre já mantém o laço de
+# varredura inteiro dentro do motor de re em C.
+#
+# Atenção: ordem importa! Mesma prioridade do PLY — regras de função na
+# ordem de definição, depois símbolos do mais longo para o mais curto.
+_PATTERNS = [
+    ("ignore", r"[ \t]+"),
+    ("ignore_comment", r"//.*"),
+    # Forma "unrolled" sem backtracking (equivalente a /\*(?:[^*]|\*+[^*/])*\*/)
+    ("comment_block", r"/\*[^*]*\*+(?:[^/*][^*]*\*+)*/"),
+    ("TEMPORAL_LITERAL", r"'(?:\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2})?|\d{2}:\d{2}:\d{2})'"),
+    ("NUMBER", r"\d+"),
+    ("STRING", r"(?:\"(?:[^\"\\]|\\.)*\"|\'(?:[^\'\\]|\\.)*\')"),
+    ("ID", r"[a-zA-Z][a-zA-Z0-9_\-\.]*"),
+    ("newline", r"\n+"),
+    ("ARROW_RL_COMPOSITION", r"<o>--"),
+    ("ARROW_RL_AGGREGATION", r"<<>--"),
+    ("ARROW_RL", r"<>--"),
+    ("ARROW_LR", r"--<>"),
+    ("DOUBLE_HYPHEN", r"--"),
+    ("DOTDOT", r"\.\."),
+    ("LBRACE", r"\{"),
+    ("RBRACE", r"\}"),
+    ("LPAREN", r"\("),
+    ("RPAREN", r"\)"),
+    ("LBRACKET", r"\["),
+    ("RBRACKET", r"\]"),
+    ("ASTERISK", r"\*"),
+    ("AT", r"@"),
+    ("COLON", r":"),
+    ("COMMA", r","),
+    ("error", r"."),
+]
+
+# Compilada uma única vez na importação do módulo.
+MASTER_RE = re.compile("|".join(f"(?P<{name}>{pat})" for name, pat in _PATTERNS))
+
+# Token leve (substitui o LexToken do PLY no caminho rápido).
+# namedtuple não tem __dict__: .type/.value/.lineno são loads de offset em
+# nível C, bem mais baratos que o lookup em dict de instância do LexToken.
+Token = namedtuple("Token", ["type", "value", "lineno"])
+
+
+
+def tokenize(code):
+    """
+    Gera Tokens percorrendo 'code' com a regex mestre.
+
+    Equivalente ao par lexer.input()/lexer.token() do PLY, mas sem o
+    overhead de uma chamada de função Python por regra de token.
+    """
+    lineno = 1
+    for m in MASTER_RE.finditer(code):
+        kind = m.lastgroup
+        value = m.group()
+
+        if kind == "ignore":
+            continue
+        if kind == "newline":
+            lineno += len(value)
+            continue
+        if kind == "ignore_comment" or kind == "comment_block":
+            lineno += value.count("\n")
+            continue
+        if kind == "error":
+            print(f"Erro Léxico: Caractere ilegal '{value}' na linha {lineno}")
+            continue
+
+        if kind == "ID":
+            # Mesmo interning do t_ID: um único objeto str por lexema
+            value = sys.intern(value)
+            yield Token(classify_id(value), value, lineno)
+        elif kind == "NUMBER":
+            yield Token(kind, int(value), lineno)
+        elif kind == "TEMPORAL_LITERAL":
+            s = value[1:-1]
+            if "T" in s:
+                yield Token("DATETIME_LITERAL", s, lineno)
+            elif "-" in s:
+                yield Token("DATE_LITERAL", s, lineno)
+            else:
+                yield Token("TIME_LITERAL", s, lineno)
+        elif kind == "STRING":
+            yield Token(kind, value[1:-1], lineno)
+            # Strings podem conter quebras de linha
+            lineno += value.count("\n")
+        else:
+            yield Token(kind, value, lineno)
 
 
 # -----------------------------------------------------------------------------
@@ -141,13 +284,8 @@ lexer = lex.lex()
 # -----------------------------------------------------------------------------
 def run_lexer_test(code_example, test_name):
     output = []
-    lexer.lineno = 1
-    lexer.input(code_example)
 
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
+    for tok in tokenize(code_example):
         output.append(
             f"Tipo: {tok.type:<25} | Lexema: '{str(tok.value):<20}' | Linha: {tok.lineno}"
         )
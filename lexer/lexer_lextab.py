@@ -0,0 +1,10 @@
+# lexer_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AGGREGATION', 'ARROW_LR', 'ARROW_RL', 'ARROW_RL_AGGREGATION', 'ARROW_RL_COMPOSITION', 'ASSOCIATION_NAME', 'ASTERISK', 'AT', 'BOOLEAN_TYPE', 'BOOLEAN_VALUE', 'BRINGSABOUT', 'CATEGORY', 'CHARACTERIZATION', 'CLASS', 'CLASS_NAME', 'COLLECTIVE', 'COLON', 'COMMA', 'COMPARATIVE', 'COMPLETE', 'COMPONENTOF', 'COMPOSITION', 'CONST', 'CONSTITUTION', 'CREATION', 'DATATYPE', 'DATETIME_LITERAL', 'DATETIME_TYPE', 'DATE_LITERAL', 'DATE_TYPE', 'DERIVATION', 'DERIVED', 'DISJOINT', 'DOTDOT', 'DOUBLE_HYPHEN', 'ENUM', 'EVENT', 'EXTERNALDEPENDENCE', 'EXTRINSICMODE', 'FORMAL', 'FUNCTIONALCOMPLEXES', 'GENERAL', 'GENSET', 'HISTORICALDEPENDENCE', 'HISTORICALROLE', 'HISTORICALROLEMIXIN', 'IMPORT', 'INHERENCE', 'INSTANCE_NAME', 'INSTANTIATION', 'INTRINSICMODE', 'INT_TYPE', 'KIND', 'LBRACE', 'LBRACKET', 'LPAREN', 'MANIFESTATION', 'MATERIAL', 'MEDIATION', 'MEMBEROF', 'MIXIN', 'MODE', 'NEW_DATATYPE', 'NUMBER', 'NUMBER_TYPE', 'OF', 'ORDERED', 'PACKAGE', 'PARTICIPATION', 'PARTICIPATIONAL', 'PHASE', 'PHASEMIXIN', 'PROCESS', 'QUALITY', 'QUANTITY', 'RBRACE', 'RBRACKET', 'REDEFINES', 'RELATION', 'RELATION_NAME', 'RELATOR', 'ROLE', 'ROLEMIXIN', 'RPAREN', 'SITUATION', 'SPECIALIZES', 'SPECIFICS', 'STRING', 'STRING_TYPE', 'SUBCOLLECTIONOF', 'SUBKIND', 'SUBQUALITYOF', 'SUBSETS', 'TEMPORAL_LITERAL', 'TERMINATION', 'TIME_LITERAL', 'TIME_TYPE', 'TRIGGERS', 'VALUE', 'WHERE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_comment_block>/\\*)|(?P<t_TEMPORAL_LITERAL>\'(?:\\d{4}-\\d{2}-\\d{2}(?:T\\d{2}:\\d{2}:\\d{2})?|\\d{2}:\\d{2}:\\d{2})\')|(?P<t_NUMBER>\\d+)|(?P<t_STRING>(\\"([^\\"\\\\]|\\\\.)*\\"|\\\'([^\\\'\\\\]|\\\\.)*\\\'))|(?P<t_ID>[a-zA-Z][a-zA-Z0-9_\\-\\.]*)|(?P<t_newline>\\n+)|(?P<t_ARROW_RL_COMPOSITION><o>--)|(?P<t_ARROW_RL_AGGREGATION><<>--)|(?P<t_ARROW_RL><>--)|(?P<t_ARROW_LR>--<>)|(?P<t_DOTDOT>\\.\\.)|(?P<t_ignore_comment>//.*)|(?P<t_DOUBLE_HYPHEN>--)|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_ASTERISK>\\*)|(?P<t_AT>@)|(?P<t_COLON>:)|(?P<t_COMMA>,)', [None, ('t_comment_block', 'comment_block'), ('t_TEMPORAL_LITERAL', 'TEMPORAL_LITERAL'), ('t_NUMBER', 'NUMBER'), ('t_STRING', 'STRING'), None, None, None, ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'ARROW_RL_COMPOSITION'), (None, 'ARROW_RL_AGGREGATION'), (None, 'ARROW_RL'), (None, 'ARROW_LR'), (None, 'DOTDOT'), (None, None), (None, 'DOUBLE_HYPHEN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'ASTERISK'), (None, 'AT'), (None, 'COLON'), (None, 'COMMA')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
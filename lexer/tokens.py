@@ -2,6 +2,8 @@
 # 1. LISTA DE TOKENS VÁLIDOS (TODOS EM MAIÚSCULO)
 # =============================================================================
 
+import sys
+
 tokens = [
     # Estereótipos de classe:
     "EVENT",
@@ -104,6 +106,7 @@ tokens = [
     "DATE_LITERAL",
     "TIME_LITERAL",
     "DATETIME_LITERAL",
+    "TEMPORAL_LITERAL",  # regra combinada; reclassificada em DATE/TIME/DATETIME
     # Meta-atributos:
     "ORDERED",
     "CONST",
@@ -116,6 +119,8 @@ tokens = [
 # 2. MAPA DE PALAVRAS RESERVADAS (reserved)
 # =============================================================================
 
+# Chaves internadas (sys.intern): a comparação de hash no lookup
+# curto-circuita por igualdade de ponteiro para lexemas repetidos.
 reserved = {
     # Estereótipos de classe:
     "event": "EVENT",
@@ -201,3 +206,5 @@ reserved = {
     "redefines": "REDEFINES",
     "int": "INT_TYPE",
 }
+
+reserved = {sys.intern(k): v for k, v in reserved.items()}
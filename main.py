@@ -1,15 +1,16 @@
 import os
 import sys
-import json  # <-- Importante para formatar a AST
 from collections import Counter
+from functools import lru_cache
 
 # --- Importações dos nossos módulos ---
 
-# Importa o lexer, necessário para a Análise Léxica (Fase 1)
-from lexer.lexer import lexer
+# Importa o tokenizador rápido, necessário para a Análise Léxica (Fase 1)
+from lexer.lexer import tokenize
 
-# Importa a função principal do parser (Fase 2)
-from parser.parser import parse_tonto_code
+# A função principal do parser (Fase 2) é importada sob demanda dentro das
+# análises sintática/semântica: o import do parser constrói as tabelas LALR
+# do PLY, custo desnecessário quando o usuário só roda a análise léxica.
 
 # Importação da Análise Semântica (Fase 3)
 from semantic.semantic import run_semantic_checks, format_unified_output
@@ -18,346 +19,61 @@ from semantic.semantic import run_semantic_checks, format_unified_output
 # EXEMPLOS DE ENTRADA (REQUISITO 1: Mantidos)
 # =============================================================================
 
-TEST_EXAMPLES = {
-    "1": {
-        "name": "CarOwnershipExample",
-        "code": """
-// Exemplo 1: Car Ownership
-package CarOwnership 
-
-kind Organization
-subkind CarAgency specializes Organization
-kind Car
-
-relator CarOwnership {
-    @mediation
-    -- involvesOwner -- [1] CarAgency
-
-    @mediation
-    -- involvesProperty -- [1] Car
-}
-""",
-    },
-    "2": {
-        "name": "CarRentalExample",
-        "code": """
-// Exemplo 2: Car Rental
-package CarRental 
-
-kind Person
-
-role Employee specializes Person
-role ResponsibleEmployee specializes Employee
-
-phase DeceasedPerson specializes Person
-phase LivingPerson specializes Person
-
-phase Child specializes LivingPerson
-phase Teenager specializes LivingPerson
-phase Adult specializes LivingPerson
-
-disjoint complete genset AgePhase {
-    general LivingPerson
-    specifics Child, Teenager, Adult
-}
-
-disjoint complete genset LifeStatus {
-    general Person
-    specifics DeceasedPerson, LivingPerson
-}
-
-roleMixin Customer
-
-role PersonalCustomer specializes Customer, Person
-
-kind Organization
-
-role CorporateCustomer specializes Organization
-
-kind Car
-
-phase AvailableCar specializes Car
-phase UnderMaintenanceCar specializes Car
-
-role RentalCar specializes AvailableCar
-
-relator CarRental {
-    @mediation
-    -- involvesRental -- [1] RentalCar
-    
-    -- involvesMediator -- [1] ResponsibleEmployee
-    
-    @mediation
-    -- involvesCustomer --[1] Customer
-}
-""",
-    },
-    "3": {
-        "name": "FoodAllergyExample",
-        "code": """
-// Exemplo 3: Alergia Alimentar
-import alergiaalimentar
-
-package alergiaalimentar
-
-kind Paciente
-
-kind Alimento
-
-subkind Proteina of functional-complexes  specializes Componente_Alimentar 
-
-phase Crianca of functional-complexes  specializes Paciente 
-
-phase Adulto of functional-complexes  specializes Paciente 
-
-subkind Aditivo_Alimentar of functional-complexes  specializes Componente_Alimentar 
-
-subkind Carboidrato of functional-complexes  specializes Componente_Alimentar 
-
-subkind Imuno_Mediada of relators  specializes Alergia 
-
-subkind Nao_Imuno_Mediada of relators  specializes Alergia 
-
-mode Sintoma
-
-subkind Cutaneo of intrinsic-modes  specializes Sintoma 
-
-subkind Gastrointestinal of intrinsic-modes  specializes Sintoma 
-
-subkind Respiratorio of intrinsic-modes  specializes Sintoma 
-
-subkind Sistemico of intrinsic-modes  specializes Sintoma 
-
-role Alergeno of functional-complexes  specializes Componente_Alimentar 
-
-relator Tratamento
+# Os códigos-fonte dos exemplos vivem em examples/*.tonto e são lidos sob
+# demanda: o import de main.py deixa de carregar ~8 KB de literais que só
+# são usados quando o exemplo correspondente é selecionado.
+_EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples")
 
-relator Diagnostico
-
-subkind Mista of relators  specializes Alergia 
-
-kind Profissional_de_Saude
-
-subkind Ingrediente of functional-complexes  specializes Alimento 
-
-subkind Formula of functional-complexes  specializes Alimento 
-
-subkind Teste_de_Dosagem_IgE_Serica of functional-complexes  specializes Procedimento 
-
-subkind Teste_de_Provocacao_Oral of functional-complexes  specializes Procedimento 
-
-kind Procedimento
-
-subkind Dieta_de_Exclusao of relators  specializes Tratamento 
-
-subkind Medicamento of relators  specializes Tratamento 
-
-subkind Imunoterapia_Oral of relators  specializes Tratamento 
-
-quality Comobidarde_Alergica
-
-quality Heranca_Genetica
-
-event Reacao_Cruzada specializes Reacao_Adversa 
-
-relator Alergia
-
-event Reacao_Adversa
-
-kind Componente_Alimentar
-
-event Consumo_Alimentar
-
-subkind Teste_Cutaneo of functional-complexes  specializes Procedimento 
-
-mode Disposicao_Alergica
-
-situation Exposicao_ao_Alergeno
-
-relator Avaliacao_de_Risco
-
-quality Nivel_de_Risco
-
-genset disjoint_complete {
-    general Componente_Alimentar
-    specifics Proteina, Aditivo_Alimentar, Carboidrato
-}
-
-genset disjoint_complete {
-    general Alergia
-    specifics Imuno_Mediada, Mista, Nao_Imuno_Mediada
-}
-
-genset disjoint_complete {
-    general Sintoma
-    specifics Respiratorio, Sistemico, Gastrointestinal, Cutaneo
-}
-
-genset disjoint_complete {
-    general Procedimento
-    specifics Teste_Cutaneo, Teste_de_Dosagem_IgE_Serica, Teste_de_Provocacao_Oral
-}
-
-genset disjoint_complete {
-    general Alimento
-    specifics Formula, Ingrediente
-}
-
-genset disjoint_complete {
-    general Paciente
-    specifics Crianca, Adulto
-}
-
-genset disjoint_complete {
-    general Tratamento
-    specifics Imunoterapia_Oral, Medicamento, Dieta_de_Exclusao
+TEST_EXAMPLES = {
+    "1": {"name": "CarOwnershipExample", "path": "car_ownership.tonto"},
+    "2": {"name": "CarRentalExample", "path": "car_rental.tonto"},
+    "3": {"name": "FoodAllergyExample", "path": "food_allergy.tonto"},
+    "4": {"name": "TDAHExample", "path": "tdah.tonto"},
 }
-""",
-    },
-    "4": {
-        "name": "TDAHExample",
-        "code": """
-// Exemplo 4: TDAH
-import TDAH
 
-package TDAH
 
-category Hyperactivity_Symptom
-
-category Neurologically_Based_Condition specializes Medical_Condition 
-
-mixin Medical_Condition 
-
-category Inattention_Symptom 
-
-role Patient specializes Person 
-
-relator Medical_Report
-
-role Doctor specializes Person 
-
-kind Person
-
-mode Behavioral_Therapy
-
-mode Medication_Therapy
-
-subkind Methylphenidate_ specializes Medicine 
-
-subkind Dextroamphetamine_ specializes Medicine 
-
-relator Prescription
-
-phase Preschool_Age specializes Patient 
-
-phase School_Age specializes Patient 
-
-phase Teenager specializes Patient 
-
-phase Adult specializes Patient 
-
-quality Birth_Sex
-
-kind Medicine
-
-role Psychologist specializes Person 
-
-kind Criterion_B
-
-kind Criterion_C
-
-kind Criterion_D
-
-kind Criterion_E
-
-kind Criterion_A1a specializes Hyperactivity_Symptom 
-
-kind Criterion_A1b specializes Hyperactivity_Symptom 
-
-kind Criterion_A1c specializes Hyperactivity_Symptom 
-
-kind Criterion_A1d specializes Hyperactivity_Symptom 
-
-kind Criterion_A1e specializes Hyperactivity_Symptom 
-
-kind Criterion_A1f specializes Hyperactivity_Symptom 
-
-kind Criterion_A1g specializes Hyperactivity_Symptom 
-
-kind Criterion_A1h specializes Hyperactivity_Symptom 
-
-kind Criterion_A1i specializes Hyperactivity_Symptom 
-
-kind Criterion_A2a specializes Inattention_Symptom 
-
-kind Criterion_A2b specializes Inattention_Symptom 
-
-kind Criterion_A2c specializes Inattention_Symptom 
-
-kind Criterion_A2d specializes Inattention_Symptom 
-
-kind Criterion_A2e specializes Inattention_Symptom 
-
-kind Criterion_A2f specializes Inattention_Symptom 
-
-kind Criterion_A2g specializes Inattention_Symptom 
-
-kind Criterion_A2h specializes Inattention_Symptom 
-
-kind Criterion_A2i specializes Inattention_Symptom 
-
-quality Severity
-
-subkind Criterion_A1 specializes Criterion_A 
-
-subkind Criterion_A2 specializes Criterion_A 
-
-kind Criterion_A
-
-kind ADHD specializes Neurologically_Based_Condition 
-
-disjoint complete genset TypesOfMedicine {
-    general Medicine
-    specifics Dextroamphetamine_, Methylphenidate_
-}
-
-disjoint complete genset PhasesOfAPatient{
-    general Patient
-    specifics Preschool_Age, School_Age, Adult, Teenager
-}
-""",
-    },
-}
+@lru_cache(maxsize=None)
+def load_example(key):
+    """Lê (uma única vez) o código do exemplo identificado por 'key'."""
+    path = os.path.join(_EXAMPLES_DIR, TEST_EXAMPLES[key]["path"])
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
 
 
 def imprimir_relatorio_amigavel(ast):
     """
     Transforma a AST bruta em uma árvore visual amigável.
     Versão Final Blindada: Aceita RelationPole e InternalRelationPole.
+
+    As linhas são acumuladas em 'out' e emitidas numa única escrita no
+    final: uma chamada de stdout em vez de uma por linha do relatório.
     """
-    print("\n" + "=" * 60)
-    print("RESUMO ESTRUTURAL DA ONTOLOGIA".center(60))
-    print("=" * 60 + "\n")
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("RESUMO ESTRUTURAL DA ONTOLOGIA".center(60))
+    out.append("=" * 60 + "\n")
 
     # 1. IMPORTS
     if ast.get("imports"):
-        print("📥 IMPORTS:")
+        out.append("📥 IMPORTS:")
         for imp in ast["imports"]:
-            print(f"   • {imp['target']}")
-        print("\n   │")
-        print("   ▼")
+            out.append(f"   • {imp['target']}")
+        out.append("\n   │")
+        out.append("   ▼")
 
     # 2. PACOTE
     pkg_name = ast["package"]["name"]
-    print(f"📦 PACOTE: {pkg_name}")
+    out.append(f"📦 PACOTE: {pkg_name}")
 
     # 3. DECLARAÇÕES
     declarations = ast["declarations"]
     if not declarations:
-        print("   └── (Nenhuma declaração encontrada)")
+        out.append("   └── (Nenhuma declaração encontrada)")
+        sys.stdout.write("\n".join(out))
+        sys.stdout.write("\n")
         return
 
-    print("   │")  # Linha conectora vertical
+    out.append("   │")  # Linha conectora vertical
 
     for i, decl in enumerate(declarations):
         is_last_decl = i == len(declarations) - 1
@@ -379,26 +95,29 @@ def imprimir_relatorio_amigavel(ast):
             if specs:
                 info_extra += f" ➡️ Specializes: {', '.join(specs)}"
 
-            print(f"{prefix} 📄 CLASSE: {name}")
-            print(f"{sub_prefix}├── Estereótipo: <<{stereo}>>{info_extra}")
+            out.append(f"{prefix} 📄 CLASSE: {name}")
+            out.append(f"{sub_prefix}├── Estereótipo: <<{stereo}>>{info_extra}")
 
-            body = decl.get("body")
-            members = body.get("members", []) if body else []
+            members = (decl.get("body") or {}).get("members", [])
 
             if not members:
-                print(f"{sub_prefix}└── (Sem atributos ou relações internas)")
+                out.append(f"{sub_prefix}└── (Sem atributos ou relações internas)")
             else:
                 for j, member in enumerate(members):
                     is_last_mem = j == len(members) - 1
                     mem_pref = "└──" if is_last_mem else "├──"
 
+                    # .get ligado uma vez por membro: evita repetir o lookup
+                    # de atributo em cada um dos 5+ acessos abaixo
+                    g = member.get
+
                     if member["type"] == "Attribute":
-                        card = member.get("cardinality")
+                        card = g("cardinality")
                         card_str = f" [{card}]" if card else ""
                         # Proteção para constraints que podem não existir
-                        con_list = member.get("constraints", [])
+                        con_list = g("constraints", [])
                         constr = f" {{{con_list[0]}}}" if con_list else ""
-                        print(
+                        out.append(
                             f"{sub_prefix}{mem_pref} 🔹 [Atributo] {member['name']} : {member['datatype']}{card_str}{constr}"
                         )
 
@@ -406,70 +125,68 @@ def imprimir_relatorio_amigavel(ast):
                     elif member["type"] in ["RelationPole", "InternalRelationPole"]:
                         # Normaliza os nomes dos campos (source/left e target/right)
                         tgt_card = (
-                            member.get("target_cardinality")
-                            or member.get("right_cardinality")
-                            or member.get("cardinality")
+                            g("target_cardinality")
+                            or g("right_cardinality")
+                            or g("cardinality")
                             or "1"
                         )
-                        src_card = member.get("source_cardinality") or member.get(
-                            "left_cardinality"
-                        )
+                        src_card = g("source_cardinality") or g("left_cardinality")
 
                         src_str = f"[{src_card}] " if src_card else ""
-                        arrow = member.get("arrow", "--")
+                        arrow = g("arrow", "--")
 
-                        rel_name = member.get("name")
+                        rel_name = g("name")
                         name_str = f" {rel_name} " if rel_name else " "
 
-                        target_cls = member.get("target_class") or member.get("target")
+                        target_cls = g("target_class") or g("target")
 
-                        print(
+                        out.append(
                             f"{sub_prefix}{mem_pref} 🔗 [Relação] {src_str}{arrow}{name_str}[{tgt_card}] ➝ {target_cls}"
                         )
 
         # --- RELAÇÃO EXTERNA (Relator) ---
         elif tipo == "RelationDeclaration":
-            print(f"{prefix} 🔗 RELAÇÃO EXTERNA: {decl['name']}")
-            print(f"{sub_prefix}├── Tipo: <<{decl['relation_type']}>>")
+            out.append(f"{prefix} 🔗 RELAÇÃO EXTERNA: {decl['name']}")
+            out.append(f"{sub_prefix}├── Tipo: <<{decl['relation_type']}>>")
 
-            body = decl.get("body")
-            members = body.get("members", []) if body else []
+            members = (decl.get("body") or {}).get("members", [])
 
             if members:
                 for j, member in enumerate(members):
                     is_last_mem = j == len(members) - 1
                     mem_pref = "└──" if is_last_mem else "├──"
 
+                    # .get ligado uma vez por membro (mesmo padrão do bloco acima)
+                    g = member.get
+
                     # AQUI ESTAVA O PROBLEMA: Aceitamos ambos os tipos agora
                     if member["type"] in ["RelationPole", "InternalRelationPole"]:
                         tgt_card = (
-                            member.get("target_cardinality")
-                            or member.get("right_cardinality")
-                            or member.get("cardinality")
+                            g("target_cardinality")
+                            or g("right_cardinality")
+                            or g("cardinality")
                             or "1"
                         )
-                        src_card = member.get("source_cardinality") or member.get(
-                            "left_cardinality"
-                        )
+                        src_card = g("source_cardinality") or g("left_cardinality")
 
                         src_str = f"[{src_card}] " if src_card else ""
-                        arrow = member.get("arrow", "--")
-                        target_cls = member.get("target_class") or member.get("target")
+                        arrow = g("arrow", "--")
+                        target_cls = g("target_class") or g("target")
 
-                        stereotype = member.get("stereotype")
+                        stereotype = g("stereotype")
                         stereo_str = f"<<{stereotype}>> " if stereotype else ""
 
-                        print(
+                        out.append(
                             f"{sub_prefix}{mem_pref} Conecta: {stereo_str}{src_str}{arrow} [{tgt_card}] ➝ {target_cls}"
                         )
             else:
-                print(f"{sub_prefix}└── (Sem conexões definidas)")
+                out.append(f"{sub_prefix}└── (Sem conexões definidas)")
 
         # --- RELAÇÃO INLINE ---
         elif tipo == "InlineRelation":
             rel_name = decl.get("relation_name") or "(Sem nome)"
-            print(f"{prefix} ⚡ RELAÇÃO INLINE: {rel_name}")
-            print(f"{sub_prefix}├── Estereótipo: <<{decl['stereotype']}>>")
+            out.append(f"{prefix} ⚡ RELAÇÃO INLINE: {rel_name}")
+            out.append(f"{sub_prefix}├── Estereótipo: <<{decl['stereotype']}>>")
 
             src = decl.get("source_class")
             src_card = decl.get("source_cardinality")
@@ -478,38 +195,41 @@ def imprimir_relatorio_amigavel(ast):
             tgt_card = decl.get("target_cardinality")
             tgt = decl.get("target_class")
 
-            print(
+            out.append(
                 f"{sub_prefix}└── {src} [{src_card}] {l_arrow} {rel_name} {r_arrow} [{tgt_card}] {tgt}"
             )
 
         # --- ENUM ---
         elif tipo == "EnumDeclaration":
-            print(f"{prefix} 🔢 ENUM: {decl['name']}")
-            print(f"{sub_prefix}└── Valores: {', '.join(decl['members'])}")
+            out.append(f"{prefix} 🔢 ENUM: {decl['name']}")
+            out.append(f"{sub_prefix}└── Valores: {', '.join(decl['members'])}")
 
         # --- DATATYPE ---
         elif tipo == "DataTypeDeclaration":
-            print(f"{prefix} 💾 DATATYPE: {decl['name']}")
+            out.append(f"{prefix} 💾 DATATYPE: {decl['name']}")
             if not decl["attributes"]:
-                print(f"{sub_prefix}└── (Vazio)")
+                out.append(f"{sub_prefix}└── (Vazio)")
             for attr in decl["attributes"]:
-                print(f"{sub_prefix}├── • {attr['name']} : {attr['datatype']}")
+                out.append(f"{sub_prefix}├── • {attr['name']} : {attr['datatype']}")
 
         # --- GENSET ---
         elif tipo == "GeneralizationSet":
-            print(f"{prefix} 🔱 GENSET: {decl['name']}")
+            out.append(f"{prefix} 🔱 GENSET: {decl['name']}")
             if decl.get("modifiers"):
-                print(f"{sub_prefix}├── Propriedades: {', '.join(decl['modifiers'])}")
-            print(f"{sub_prefix}├── Geral: {decl['general']}")
+                out.append(f"{sub_prefix}├── Propriedades: {', '.join(decl['modifiers'])}")
+            out.append(f"{sub_prefix}├── Geral: {decl['general']}")
             if decl.get("categorizer"):
-                print(f"{sub_prefix}├── Categorizador: {decl['categorizer']}")
-            print(f"{sub_prefix}└── Específicos: {', '.join(decl['specifics'])}")
+                out.append(f"{sub_prefix}├── Categorizador: {decl['categorizer']}")
+            out.append(f"{sub_prefix}└── Específicos: {', '.join(decl['specifics'])}")
 
         # --- TYPE ---
         elif tipo == "HighOrderType":
-            print(f"{prefix} 🆙 TYPE: {decl['name']}")
+            out.append(f"{prefix} 🆙 TYPE: {decl['name']}")
+
+    out.append("\n" + "=" * 60 + "\n")
 
-    print("\n" + "=" * 60 + "\n")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
 
 
 # =============================================================================
@@ -517,23 +237,36 @@ def imprimir_relatorio_amigavel(ast):
 # =============================================================================
 
 
-def run_analysis_lexica(codigo_para_analise, nome_do_teste):
-    """Executa a ANÁLISE LÉXICA (Fase 1)"""
-    print(f"\n--- Iniciando Análise LÉXICA para: {nome_do_teste} ---")
+def run_analysis_lexica(codigo_para_analise, nome_do_teste, verbose=True):
+    """Executa a ANÁLISE LÉXICA (Fase 1)
 
-    token_counts = Counter()
-    lexer.lineno = 1
-    lexer.input(codigo_para_analise)
+    Com verbose=False pula a listagem token a token (o custo dominante em
+    arquivos grandes) e imprime apenas a tabela de síntese.
+    """
+    print(f"\n--- Iniciando Análise LÉXICA para: {nome_do_teste} ---")
 
-    print("\n=== VISÃO ANALÍTICA (LISTA DE TOKENS) ===")
-    while True:
-        token = lexer.token()
-        if not token:
-            break
-        print(
-            f"  [Tipo: {token.type:<20} Lexema: '{token.value}' Linha: {token.lineno}]"
-        )
-        token_counts[token.type] += 1
+    if verbose:
+        # Materializa a lista de tokens e delega o histograma ao construtor do
+        # Counter, que conta em nível C (_count_elements) em vez de dois
+        # acessos de dict interpretados por token.
+        tokens_list = list(tokenize(codigo_para_analise))
+        token_counts = Counter(token.type for token in tokens_list)
+
+        print("\n=== VISÃO ANALÍTICA (LISTA DE TOKENS) ===")
+        # Acumula as linhas e emite tudo em uma única escrita: evita o custo
+        # de formatação + flush de um print() por token. O desempacotamento
+        # da namedtuple substitui três LOAD_ATTR por token por um UNPACK.
+        lines = [
+            f"  [Tipo: {tok_type:<20} Lexema: '{tok_value}' Linha: {tok_lineno}]"
+            for tok_type, tok_value, tok_lineno in tokens_list
+        ]
+
+        if lines:
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.write("\n")
+    else:
+        # Só a contagem: nenhuma formatação por token.
+        token_counts = Counter(token.type for token in tokenize(codigo_para_analise))
 
     print("\n" + "=" * 50)
     print("=== TABELA DE SÍNTESE (CONTAGEM DE TOKENS) ===".center(50))
@@ -548,6 +281,8 @@ def run_analysis_lexica(codigo_para_analise, nome_do_teste):
 
 def run_analysis_sintatica(codigo_para_analise, nome_do_teste):
     """Executa a ANÁLISE SINTÁTICA (Fase 2)"""
+    from parser.parser import parse_tonto_code
+
     print(f"\n--- Iniciando Análise SINTÁTICA para: {nome_do_teste} ---")
 
     ast_result = parse_tonto_code(codigo_para_analise)
@@ -568,6 +303,8 @@ def run_analysis_sintatica(codigo_para_analise, nome_do_teste):
 
 def run_analysis_semantica(codigo_para_analise, nome_do_teste):
     """Executa a ANÁLISE SEMÂNTICA (Fase 3)"""
+    from parser.parser import parse_tonto_code
+
     print(f"\n--- Iniciando Análise SEMÂNTICA para: {nome_do_teste} ---")
 
     # 1. Obter a Árvore de Sintaxe Abstrata (AST) a partir do código
@@ -596,21 +333,31 @@ def run_analysis_semantica(codigo_para_analise, nome_do_teste):
 # LOOP PRINCIPAL (MAIN)
 # =============================================================================
 
+ANALYSIS_FUNCTIONS = {
+    "1": ("Análise Léxica (Fase 1)", run_analysis_lexica),
+    "2": ("Análise Sintática (Fase 2)", run_analysis_sintatica),
+    "3": ("Análise Semântica (Fase 3)", run_analysis_semantica),
+}
+
+# Menus pré-renderizados: as opções nunca mudam, então as strings são
+# montadas uma única vez no import em vez de a cada redesenho do menu.
+ANALYSIS_MENU_STR = "\n".join(
+    f"  {key}. {name}" for key, (name, _) in ANALYSIS_FUNCTIONS.items()
+)
+EXAMPLES_MENU_STR = "\n".join(
+    f"  {key}. {example['name']}" for key, example in TEST_EXAMPLES.items()
+)
+
 
 def main():
-    analysis_functions = {
-        "1": ("Análise Léxica (Fase 1)", run_analysis_lexica),
-        "2": ("Análise Sintática (Fase 2)", run_analysis_sintatica),
-        "3": ("Análise Semântica (Fase 3)", run_analysis_semantica),
-    }
+    analysis_functions = ANALYSIS_FUNCTIONS
 
     while True:
         print("\n" + "=" * 60)
         print("  ANALISADOR DE LINGUAGEM TONTO".center(60))
         print("=" * 60)
         print("Selecione o TIPO de análise que deseja executar:")
-        for key, (name, _) in analysis_functions.items():
-            print(f"  {key}. {name}")
+        print(ANALYSIS_MENU_STR)
         print("  Q. Sair")
 
         tipo_escolha = input("Digite sua escolha: ").strip().upper()
@@ -630,8 +377,7 @@ def main():
             print(f"Executando: {selected_analysis_name}")
             print("Selecione uma opção para analisar:")
 
-            for key, example in TEST_EXAMPLES.items():
-                print(f"  {key}. {example['name']}")
+            print(EXAMPLES_MENU_STR)
             print("  E. Analisar um arquivo externo (.tonto)")
             print("  V. Voltar ao menu anterior")
 
@@ -644,7 +390,7 @@ def main():
             nome_do_teste = ""
 
             if exemplo_escolha in TEST_EXAMPLES:
-                codigo_para_analise = TEST_EXAMPLES[exemplo_escolha]["code"]
+                codigo_para_analise = load_example(exemplo_escolha)
                 nome_do_teste = TEST_EXAMPLES[exemplo_escolha]["name"]
 
             elif exemplo_escolha == "E":
@@ -666,7 +412,20 @@ def main():
                 continue
 
             # Executa a análise
-            funcao_analise(codigo_para_analise, nome_do_teste)
+            if funcao_analise is run_analysis_lexica:
+                # Arquivos externos podem ser grandes: o padrão vira só síntese
+                padrao = "N" if exemplo_escolha == "E" else "S"
+                resp = (
+                    input(f"Mostrar visão analítica token a token? (S/N) [{padrao}]: ")
+                    .strip()
+                    .upper()
+                    or padrao
+                )
+                funcao_analise(
+                    codigo_para_analise, nome_do_teste, verbose=(resp != "N")
+                )
+            else:
+                funcao_analise(codigo_para_analise, nome_do_teste)
             input("\nPressione ENTER para continuar...")
             break
 
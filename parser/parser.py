@@ -1,18 +1,31 @@
 import ply.yacc as yacc
+import hashlib
 import json
 import os
+from bisect import bisect_left
+
+from .rd_parser import parse_code as _rd_parse_code
+
+# O parser descendente recursivo (rd_parser.py) é o padrão: evita o
+# interpretador de tabelas do yacc (uma chamada Python por shift/reduce).
+# Defina TONTO_PARSER=ply para voltar ao front-end LALR como fallback.
+USE_RD_PARSER = os.environ.get("TONTO_PARSER", "rd").lower() != "ply"
 
 CURRENT_CODE = ""
 
+# Posições das quebras de linha de CURRENT_CODE, calculadas uma única vez
+# por parse: cada consulta vira uma busca binária O(log n) em vez de um
+# count("\n", 0, pos) que revarre o prefixo inteiro a cada declaração.
+NEWLINE_POSITIONS = []
+
 
 def lineno_from_pos(pos: int) -> int:
     """
-    Calcula o número da linha contando quebras de linha em CURRENT_CODE
-    até a posição 'pos'.
+    Calcula o número da linha a partir da tabela de offsets NEWLINE_POSITIONS.
     """
     if pos is None or pos < 0:
         return 0
-    return CURRENT_CODE.count("\n", 0, pos) + 1
+    return bisect_left(NEWLINE_POSITIONS, pos) + 1
 
 
 # =============================================================================
@@ -44,11 +57,15 @@ def p_programa(p):
     }
 
 
+# Listas em recursão à esquerda: o LR reduz com pilha de profundidade
+# constante e um único append amortizado O(1) por item, em vez da
+# concatenação [p[1]] + p[2] (quadrática) da forma à direita.
 def p_pre_package_decls(p):
-    """pre_package_decls : declaracao_import pre_package_decls
+    """pre_package_decls : pre_package_decls declaracao_import
     | empty"""
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -86,10 +103,11 @@ def p_class_identifier(p):
 # C. LISTA DE DECLARAÇÕES
 # ----------------------------------
 def p_declaracoes_pos_package(p):
-    """declaracoes_pos_package : declaracao declaracoes_pos_package
+    """declaracoes_pos_package : declaracoes_pos_package declaracao
     | empty"""
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -170,10 +188,11 @@ def p_classe_body(p):
 
 
 def p_lista_membros_classe(p):
-    """lista_membros_classe : membro_classe lista_membros_classe
+    """lista_membros_classe : lista_membros_classe membro_classe
     | empty"""
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -211,98 +230,30 @@ def p_lista_nomes_classe(p):
 
 
 # --- ESTEREÓTIPOS DE CLASSE ---
-def p_estereotipo_classe_1(p):
-    """estereotipo_classe : EVENT"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_2(p):
-    """estereotipo_classe : SITUATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_3(p):
-    """estereotipo_classe : PROCESS"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_4(p):
-    """estereotipo_classe : CATEGORY"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_5(p):
-    """estereotipo_classe : MIXIN"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_6(p):
-    """estereotipo_classe : PHASEMIXIN"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_7(p):
-    """estereotipo_classe : ROLEMIXIN"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_8(p):
-    """estereotipo_classe : HISTORICALROLEMIXIN"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_9(p):
-    """estereotipo_classe : KIND"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_10(p):
-    """estereotipo_classe : COLLECTIVE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_11(p):
-    """estereotipo_classe : QUANTITY"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_12(p):
-    """estereotipo_classe : QUALITY"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_13(p):
-    """estereotipo_classe : MODE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_14(p):
-    """estereotipo_classe : INTRINSICMODE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_15(p):
-    """estereotipo_classe : EXTRINSICMODE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_16(p):
-    """estereotipo_classe : SUBKIND"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_17(p):
-    """estereotipo_classe : PHASE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_18(p):
-    """estereotipo_classe : ROLE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_classe_19(p):
-    """estereotipo_classe : HISTORICALROLE"""
+# Alternativas num único docstring: o PLY gera uma produção por ramo mas
+# compartilha a mesma função de ação, encolhendo a tabela LR e o número
+# de objetos de função inspecionados no import.
+def p_estereotipo_classe(p):
+    """estereotipo_classe : EVENT
+    | SITUATION
+    | PROCESS
+    | CATEGORY
+    | MIXIN
+    | PHASEMIXIN
+    | ROLEMIXIN
+    | HISTORICALROLEMIXIN
+    | KIND
+    | COLLECTIVE
+    | QUANTITY
+    | QUALITY
+    | MODE
+    | INTRINSICMODE
+    | EXTRINSICMODE
+    | SUBKIND
+    | PHASE
+    | ROLE
+    | HISTORICALROLE
+    """
     p[0] = p[1]
 
 
@@ -317,10 +268,11 @@ def p_declaracao_enum(p):
 
 # (MODIFICADO) Usa class_identifier para membros do enum
 def p_lista_individuos(p):
-    """lista_individuos : class_identifier COMMA lista_individuos
+    """lista_individuos : lista_individuos COMMA class_identifier
     | class_identifier"""
     if len(p) == 4:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -335,11 +287,12 @@ def p_declaracao_datatype(p):
 
 
 def p_lista_atributos_datatype(p):
-    """lista_atributos_datatype : atributo_datatype COMMA lista_atributos_datatype
+    """lista_atributos_datatype : lista_atributos_datatype COMMA atributo_datatype
     | atributo_datatype
     | empty"""
     if len(p) == 4:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
     elif len(p) == 2 and p[1] is not None:
         p[0] = [p[1]]
     else:
@@ -365,38 +318,15 @@ def p_tipo_atributo(p):
 
 
 # --- TIPOS PRIMITIVOS ---
-def p_tipo_primitivo_1(p):
-    """tipo_primitivo : NUMBER_TYPE"""
-    p[0] = p[1]
-
-
-def p_tipo_primitivo_2(p):
-    """tipo_primitivo : STRING_TYPE"""
-    p[0] = p[1]
-
-
-def p_tipo_primitivo_3(p):
-    """tipo_primitivo : BOOLEAN_TYPE"""
-    p[0] = p[1]
-
-
-def p_tipo_primitivo_4(p):
-    """tipo_primitivo : DATE_TYPE"""
-    p[0] = p[1]
-
-
-def p_tipo_primitivo_5(p):
-    """tipo_primitivo : TIME_TYPE"""
-    p[0] = p[1]
-
-
-def p_tipo_primitivo_6(p):
-    """tipo_primitivo : DATETIME_TYPE"""
-    p[0] = p[1]
-
-
-def p_tipo_primitivo_7(p):
-    """tipo_primitivo : INT_TYPE"""
+def p_tipo_primitivo(p):
+    """tipo_primitivo : NUMBER_TYPE
+    | STRING_TYPE
+    | BOOLEAN_TYPE
+    | DATE_TYPE
+    | TIME_TYPE
+    | DATETIME_TYPE
+    | INT_TYPE
+    """
     p[0] = p[1]
 
 
@@ -417,10 +347,11 @@ def p_declaracao_genset(p):
 
 
 def p_genset_modifiers(p):
-    """genset_modifiers : genset_modifier genset_modifiers
+    """genset_modifiers : genset_modifiers genset_modifier
     | empty"""
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -490,10 +421,11 @@ def p_relation_body(p):
 
 
 def p_relation_members(p):
-    """relation_members : relation_member relation_members
+    """relation_members : relation_members relation_member
     | empty"""
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -601,128 +533,33 @@ def p_declaracao_association(p):
 
 
 # --- ESTEREÓTIPOS DE RELAÇÃO ---
-def p_estereotipo_relacao_1(p):
-    """estereotipo_relacao : MATERIAL"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_2(p):
-    """estereotipo_relacao : DERIVATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_3(p):
-    """estereotipo_relacao : COMPARATIVE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_4(p):
-    """estereotipo_relacao : MEDIATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_5(p):
-    """estereotipo_relacao : CHARACTERIZATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_6(p):
-    """estereotipo_relacao : EXTERNALDEPENDENCE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_7(p):
-    """estereotipo_relacao : COMPONENTOF"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_8(p):
-    """estereotipo_relacao : MEMBEROF"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_9(p):
-    """estereotipo_relacao : SUBCOLLECTIONOF"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_10(p):
-    """estereotipo_relacao : SUBQUALITYOF"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_11(p):
-    """estereotipo_relacao : INSTANTIATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_12(p):
-    """estereotipo_relacao : TERMINATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_13(p):
-    """estereotipo_relacao : PARTICIPATIONAL"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_14(p):
-    """estereotipo_relacao : PARTICIPATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_15(p):
-    """estereotipo_relacao : HISTORICALDEPENDENCE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_16(p):
-    """estereotipo_relacao : CREATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_17(p):
-    """estereotipo_relacao : MANIFESTATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_18(p):
-    """estereotipo_relacao : BRINGSABOUT"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_19(p):
-    """estereotipo_relacao : TRIGGERS"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_20(p):
-    """estereotipo_relacao : COMPOSITION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_21(p):
-    """estereotipo_relacao : AGGREGATION"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_22(p):
-    """estereotipo_relacao : INHERENCE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_23(p):
-    """estereotipo_relacao : VALUE"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_24(p):
-    """estereotipo_relacao : FORMAL"""
-    p[0] = p[1]
-
-
-def p_estereotipo_relacao_25(p):
-    """estereotipo_relacao : CONSTITUTION"""
+def p_estereotipo_relacao(p):
+    """estereotipo_relacao : MATERIAL
+    | DERIVATION
+    | COMPARATIVE
+    | MEDIATION
+    | CHARACTERIZATION
+    | EXTERNALDEPENDENCE
+    | COMPONENTOF
+    | MEMBEROF
+    | SUBCOLLECTIONOF
+    | SUBQUALITYOF
+    | INSTANTIATION
+    | TERMINATION
+    | PARTICIPATIONAL
+    | PARTICIPATION
+    | HISTORICALDEPENDENCE
+    | CREATION
+    | MANIFESTATION
+    | BRINGSABOUT
+    | TRIGGERS
+    | COMPOSITION
+    | AGGREGATION
+    | INHERENCE
+    | VALUE
+    | FORMAL
+    | CONSTITUTION
+    """
     p[0] = p[1]
 
 
@@ -734,15 +571,15 @@ def p_empty(p):
     pass
 
 
-global has_error
-has_error = False
-
-
 def p_error(p):
     """Tratamento de erro sintático."""
-    global has_error
-    has_error = True
-    if p:
+    # Estado no próprio objeto parser, e não num global mutável do módulo:
+    # cada instância de yacc carrega seu próprio flag, o caminho para
+    # paralelizar o parse de vários arquivos com instâncias dedicadas.
+    # (Esta versão do PLY não passa a instância para p_error; usamos o
+    # parser do módulo, único existente neste caminho.)
+    parser.has_error = True
+    if p is not None:
         print(
             f"\n[ERRO SINTÁTICO] Token inesperado: {p.type} ('{p.value}') na linha {p.lineno}"
         )
@@ -756,26 +593,68 @@ def p_error(p):
 # 4. CONSTRUÇÃO DO PARSER
 # =============================================================================
 # print("DEBUG PARSER FILE:", __file__)
+# optimize=1: confia no parsetab.py pré-gerado (versionado junto com o
+# código) e pula a validação de gramática/assinatura a cada import — o
+# custo dominante de inicialização para entradas curtas. Ao alterar a
+# gramática, apague parser/parsetab.py para forçar a regeneração.
 parser = yacc.yacc(
+    optimize=1,
     write_tables=True,  # gera (e depois reutiliza) parsetab.py
     debug=False,
     tabmodule="parsetab",  # nome do arquivo de tabelas
+    errorlog=yacc.NullLogger(),
 )
 
 
+# Cache de resultados por digest do fonte: reexecuções do menu (ou usos
+# estilo IDE) sobre o mesmo código pulam o parse inteiro. blake2b em
+# digest_size=16 é mais rápido que sha256 e está na stdlib. Parses com erro
+# (AST None) nunca entram no cache, para que as mensagens de erro sejam
+# reimpressas a cada tentativa. Eviction FIFO com teto pequeno.
+_PARSE_CACHE = {}
+_PARSE_CACHE_MAX = 64
+
+
 def parse_tonto_code(code_string):
     """
     Função principal para analisar o código TONTO.
     """
-    global has_error, CURRENT_CODE
-    has_error = False
+    global CURRENT_CODE, NEWLINE_POSITIONS
 
     # Normaliza EOL para garantir coerência
     code_string = code_string.replace("\r\n", "\n").replace("\r", "\n")
+
+    digest = hashlib.blake2b(code_string.encode(), digest_size=16).digest()
+    cached = _PARSE_CACHE.get(digest)
+    if cached is not None:
+        return cached
+
     CURRENT_CODE = code_string
 
+    if USE_RD_PARSER:
+        ast_result = _rd_parse_code(code_string)
+        if ast_result is not None:
+            if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+                _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+            _PARSE_CACHE[digest] = ast_result
+        return ast_result
+
+    # Uma passada linear com str.find (nível C) monta a tabela de offsets
+    positions = []
+    find = code_string.find
+    i = find("\n")
+    while i != -1:
+        positions.append(i)
+        i = find("\n", i + 1)
+    NEWLINE_POSITIONS = positions
+
     lexer.lineno = 1
+    parser.has_error = False
     ast_result = parser.parse(code_string, lexer=lexer)
-    if has_error:
+    if parser.has_error:
         return None
+    if ast_result is not None:
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+        _PARSE_CACHE[digest] = ast_result
     return ast_result
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AGGREGATION ARROW_LR ARROW_RL ARROW_RL_AGGREGATION ARROW_RL_COMPOSITION ASSOCIATION_NAME ASTERISK AT BOOLEAN_TYPE BOOLEAN_VALUE BRINGSABOUT CATEGORY CHARACTERIZATION CLASS CLASS_NAME COLLECTIVE COLON COMMA COMPARATIVE COMPLETE COMPONENTOF COMPOSITION CONST CONSTITUTION CREATION DATATYPE DATETIME_LITERAL DATETIME_TYPE DATE_LITERAL DATE_TYPE DERIVATION DERIVED DISJOINT DOTDOT DOUBLE_HYPHEN ENUM EVENT EXTERNALDEPENDENCE EXTRINSICMODE FORMAL FUNCTIONALCOMPLEXES GENERAL GENSET HISTORICALDEPENDENCE HISTORICALROLE HISTORICALROLEMIXIN IMPORT INHERENCE INSTANCE_NAME INSTANTIATION INTRINSICMODE INT_TYPE KIND LBRACE LBRACKET LPAREN MANIFESTATION MATERIAL MEDIATION MEMBEROF MIXIN MODE NEW_DATATYPE NUMBER NUMBER_TYPE OF ORDERED PACKAGE PARTICIPATION PARTICIPATIONAL PHASE PHASEMIXIN PROCESS QUALITY QUANTITY RBRACE RBRACKET REDEFINES RELATION RELATION_NAME RELATOR ROLE ROLEMIXIN RPAREN SITUATION SPECIALIZES SPECIFICS STRING STRING_TYPE SUBCOLLECTIONOF SUBKIND SUBQUALITYOF SUBSETS TERMINATION TIME_LITERAL TIME_TYPE TRIGGERS VALUE WHEREprograma : pre_package_decls declaracao_package declaracoes_pos_packagepre_package_decls : declaracao_import pre_package_decls\n| emptydeclaracao_import : IMPORT nome_identificadordeclaracao_package : PACKAGE nome_identificadornome_identificador : CLASS_NAME\n| RELATION_NAME\n| INSTANCE_NAMEclass_identifier : CLASS_NAME\n| INSTANCE_NAME\n| RELATION_NAMEdeclaracoes_pos_package : declaracao declaracoes_pos_package\n| emptydeclaracao : declaracao_classe\n| declaracao_enum\n| declaracao_datatype\n| declaracao_genset\n| declaracao_relacao_externa\n| declaracao_relacao_inline\n| declaracao_associationdeclaracao_classe : estereotipo_classe class_identifier classe_natureza_opcional classe_specialization classe_bodyclasse_natureza_opcional : OF natureza_classe\n| emptynatureza_classe : FUNCTIONALCOMPLEXES\n| RELATOR\n| RELATION_NAME\n| INTRINSICMODE\n| EXTRINSICMODE\n| QUALITY\n| MODE\n| EVENT\n| SITUATIONclasse_specialization : SPECIALIZES lista_nomes_classe\n| emptyclasse_body : LBRACE lista_membros_classe RBRACE\n| emptylista_membros_classe : membro_classe lista_membros_classe\n| emptymembro_classe : atributo_datatype\n| declaracao_relacao_interna\n| classe_relation_internalclasse_relation_internal : AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifierlista_nomes_classe : lista_nomes_classe COMMA class_identifier\n| class_identifierestereotipo_classe : EVENTestereotipo_classe : SITUATIONestereotipo_classe : PROCESSestereotipo_classe : CATEGORYestereotipo_classe : MIXINestereotipo_classe : PHASEMIXINestereotipo_classe : ROLEMIXINestereotipo_classe : HISTORICALROLEMIXINestereotipo_classe : KINDestereotipo_classe : COLLECTIVEestereotipo_classe : QUANTITYestereotipo_classe : QUALITYestereotipo_classe : MODEestereotipo_classe : INTRINSICMODEestereotipo_classe : EXTRINSICMODEestereotipo_classe : SUBKINDestereotipo_classe : PHASEestereotipo_classe : ROLEestereotipo_classe : HISTORICALROLEdeclaracao_enum : ENUM class_identifier LBRACE lista_individuos RBRACElista_individuos : class_identifier COMMA lista_individuos\n| class_identifierdeclaracao_datatype : DATATYPE class_identifier LBRACE lista_atributos_datatype RBRACElista_atributos_datatype : atributo_datatype COMMA lista_atributos_datatype\n| atributo_datatype\n| emptyatributo_datatype : RELATION_NAME COLON tipo_atributo cardinalidade_opcionaltipo_atributo : tipo_primitivo\n| class_identifiertipo_primitivo : NUMBER_TYPEtipo_primitivo : STRING_TYPEtipo_primitivo : BOOLEAN_TYPEtipo_primitivo : DATE_TYPEtipo_primitivo : TIME_TYPEtipo_primitivo : DATETIME_TYPEtipo_primitivo : INT_TYPEdeclaracao_genset : genset_modifiers GENSET nome_identificador genset_formgenset_modifiers : genset_modifier genset_modifiers\n| emptygenset_modifier : DISJOINT\n| COMPLETEgenset_form : genset_form_where\n| genset_form_blockgenset_form_where : WHERE lista_nomes_classe SPECIALIZES class_identifier\ngenset_form_block : LBRACE GENERAL class_identifier maybe_comma SPECIFICS lista_nomes_classe RBRACE\nmaybe_comma : COMMA\n| emptydeclaracao_relacao_externa : tipo_relacao_externa class_identifier classe_specialization relation_bodyrelation_body : LBRACE relation_members RBRACE\n| emptyrelation_members : relation_member relation_members\n| emptyrelation_member : declaracao_relacao_interna\n| atributo_datatype\n| relacao_interna_relatortipo_relacao_externa : RELATOR\n| RELATIONdeclaracao_relacao_inline : AT estereotipo_relacao RELATION class_identifier cardinalidade_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifierrelacao_interna_relator : AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifierdeclaracao_relacao_interna : estereotipo_relacao_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifierseta : DOUBLE_HYPHEN\n| ARROW_RL\n| ARROW_LR\n| ARROW_RL_COMPOSITION\n| ARROW_RL_AGGREGATIONestereotipo_relacao_opcional : AT estereotipo_relacao\n| emptycardinalidade_opcional : LBRACKET cardinalidade_valor RBRACKET\n| emptycardinalidade_valor : NUMBER\n| ASTERISK\n| NUMBER DOTDOT NUMBER\n| NUMBER DOTDOT ASTERISKdeclaracao_association : ASSOCIATION_NAME class_identifier classe_bodyestereotipo_relacao : MATERIALestereotipo_relacao : DERIVATIONestereotipo_relacao : COMPARATIVEestereotipo_relacao : MEDIATIONestereotipo_relacao : CHARACTERIZATIONestereotipo_relacao : EXTERNALDEPENDENCEestereotipo_relacao : COMPONENTOFestereotipo_relacao : MEMBEROFestereotipo_relacao : SUBCOLLECTIONOFestereotipo_relacao : SUBQUALITYOFestereotipo_relacao : INSTANTIATIONestereotipo_relacao : TERMINATIONestereotipo_relacao : PARTICIPATIONALestereotipo_relacao : PARTICIPATIONestereotipo_relacao : HISTORICALDEPENDENCEestereotipo_relacao : CREATIONestereotipo_relacao : MANIFESTATIONestereotipo_relacao : BRINGSABOUTestereotipo_relacao : TRIGGERSestereotipo_relacao : COMPOSITIONestereotipo_relacao : AGGREGATIONestereotipo_relacao : INHERENCEestereotipo_relacao : VALUEestereotipo_relacao : FORMALestereotipo_relacao : CONSTITUTIONempty :'
+_lr_signature = 'AGGREGATION ARROW_LR ARROW_RL ARROW_RL_AGGREGATION ARROW_RL_COMPOSITION ASSOCIATION_NAME ASTERISK AT BOOLEAN_TYPE BOOLEAN_VALUE BRINGSABOUT CATEGORY CHARACTERIZATION CLASS CLASS_NAME COLLECTIVE COLON COMMA COMPARATIVE COMPLETE COMPONENTOF COMPOSITION CONST CONSTITUTION CREATION DATATYPE DATETIME_LITERAL DATETIME_TYPE DATE_LITERAL DATE_TYPE DERIVATION DERIVED DISJOINT DOTDOT DOUBLE_HYPHEN ENUM EVENT EXTERNALDEPENDENCE EXTRINSICMODE FORMAL FUNCTIONALCOMPLEXES GENERAL GENSET HISTORICALDEPENDENCE HISTORICALROLE HISTORICALROLEMIXIN IMPORT INHERENCE INSTANCE_NAME INSTANTIATION INTRINSICMODE INT_TYPE KIND LBRACE LBRACKET LPAREN MANIFESTATION MATERIAL MEDIATION MEMBEROF MIXIN MODE NEW_DATATYPE NUMBER NUMBER_TYPE OF ORDERED PACKAGE PARTICIPATION PARTICIPATIONAL PHASE PHASEMIXIN PROCESS QUALITY QUANTITY RBRACE RBRACKET REDEFINES RELATION RELATION_NAME RELATOR ROLE ROLEMIXIN RPAREN SITUATION SPECIALIZES SPECIFICS STRING STRING_TYPE SUBCOLLECTIONOF SUBKIND SUBQUALITYOF SUBSETS TEMPORAL_LITERAL TERMINATION TIME_LITERAL TIME_TYPE TRIGGERS VALUE WHEREprograma : pre_package_decls declaracao_package declaracoes_pos_packagepre_package_decls : pre_package_decls declaracao_import\n    | emptydeclaracao_import : IMPORT nome_identificadordeclaracao_package : PACKAGE nome_identificadornome_identificador : CLASS_NAME\n    | RELATION_NAME\n    | INSTANCE_NAMEclass_identifier : CLASS_NAME\n    | INSTANCE_NAME\n    | RELATION_NAMEdeclaracoes_pos_package : declaracoes_pos_package declaracao\n    | emptydeclaracao : declaracao_classe\n    | declaracao_enum\n    | declaracao_datatype\n    | declaracao_genset\n    | declaracao_relacao_externa\n    | declaracao_relacao_inline\n    | declaracao_associationdeclaracao_classe : estereotipo_classe class_identifier classe_natureza_opcional classe_specialization classe_bodyclasse_natureza_opcional : OF natureza_classe\n    | emptynatureza_classe : FUNCTIONALCOMPLEXES\n    | RELATOR\n    | RELATION_NAME\n    | INTRINSICMODE\n    | EXTRINSICMODE\n    | QUALITY\n    | MODE\n    | EVENT\n    | SITUATIONclasse_specialization : SPECIALIZES lista_nomes_classe\n    | emptyclasse_body : LBRACE lista_membros_classe RBRACE\n    | emptylista_membros_classe : lista_membros_classe membro_classe\n    | emptymembro_classe : atributo_datatype\n    | declaracao_relacao_interna\n    | classe_relation_internalclasse_relation_internal : AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifierlista_nomes_classe : lista_nomes_classe COMMA class_identifier\n    | class_identifierestereotipo_classe : EVENT\n    | SITUATION\n    | PROCESS\n    | CATEGORY\n    | MIXIN\n    | PHASEMIXIN\n    | ROLEMIXIN\n    | HISTORICALROLEMIXIN\n    | KIND\n    | COLLECTIVE\n    | QUANTITY\n    | QUALITY\n    | MODE\n    | INTRINSICMODE\n    | EXTRINSICMODE\n    | SUBKIND\n    | PHASE\n    | ROLE\n    | HISTORICALROLE\n    declaracao_enum : ENUM class_identifier LBRACE lista_individuos RBRACElista_individuos : lista_individuos COMMA class_identifier\n    | class_identifierdeclaracao_datatype : DATATYPE class_identifier LBRACE lista_atributos_datatype RBRACElista_atributos_datatype : lista_atributos_datatype COMMA atributo_datatype\n    | atributo_datatype\n    | emptyatributo_datatype : RELATION_NAME COLON tipo_atributo cardinalidade_opcionaltipo_atributo : tipo_primitivo\n    | class_identifiertipo_primitivo : NUMBER_TYPE\n    | STRING_TYPE\n    | BOOLEAN_TYPE\n    | DATE_TYPE\n    | TIME_TYPE\n    | DATETIME_TYPE\n    | INT_TYPE\n    declaracao_genset : genset_modifiers GENSET nome_identificador genset_formgenset_modifiers : genset_modifiers genset_modifier\n    | emptygenset_modifier : DISJOINT\n    | COMPLETEgenset_form : genset_form_where\n    | genset_form_blockgenset_form_where : WHERE lista_nomes_classe SPECIALIZES class_identifier\n    genset_form_block : LBRACE GENERAL class_identifier maybe_comma SPECIFICS lista_nomes_classe RBRACE\n    maybe_comma : COMMA\n    | emptydeclaracao_relacao_externa : tipo_relacao_externa class_identifier classe_specialization relation_bodyrelation_body : LBRACE relation_members RBRACE\n    | emptyrelation_members : relation_members relation_member\n    | emptyrelation_member : declaracao_relacao_interna\n    | atributo_datatype\n    | relacao_interna_relatortipo_relacao_externa : RELATOR\n    | RELATIONdeclaracao_relacao_inline : AT estereotipo_relacao RELATION class_identifier cardinalidade_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifierrelacao_interna_relator : AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifierdeclaracao_relacao_interna : estereotipo_relacao_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifierseta : DOUBLE_HYPHEN\n    | ARROW_RL\n    | ARROW_LR\n    | ARROW_RL_COMPOSITION\n    | ARROW_RL_AGGREGATIONestereotipo_relacao_opcional : AT estereotipo_relacao\n    | emptycardinalidade_opcional : LBRACKET cardinalidade_valor RBRACKET\n    | emptycardinalidade_valor : NUMBER\n    | ASTERISK\n    | NUMBER DOTDOT NUMBER\n    | NUMBER DOTDOT ASTERISKdeclaracao_association : ASSOCIATION_NAME class_identifier classe_bodyestereotipo_relacao : MATERIAL\n    | DERIVATION\n    | COMPARATIVE\n    | MEDIATION\n    | CHARACTERIZATION\n    | EXTERNALDEPENDENCE\n    | COMPONENTOF\n    | MEMBEROF\n    | SUBCOLLECTIONOF\n    | SUBQUALITYOF\n    | INSTANTIATION\n    | TERMINATION\n    | PARTICIPATIONAL\n    | PARTICIPATION\n    | HISTORICALDEPENDENCE\n    | CREATION\n    | MANIFESTATION\n    | BRINGSABOUT\n    | TRIGGERS\n    | COMPOSITION\n    | AGGREGATION\n    | INHERENCE\n    | VALUE\n    | FORMAL\n    | CONSTITUTION\n    empty :'
     
-_lr_action_items = {'IMPORT':([0,3,9,10,11,12,],[5,5,-4,-6,-7,-8,]),'PACKAGE':([0,2,3,4,8,9,10,11,12,],[-144,7,-144,-3,-2,-4,-6,-7,-8,]),'$end':([1,6,10,11,12,13,14,15,16,17,18,19,20,21,22,54,55,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[0,-144,-6,-7,-8,-1,-144,-13,-14,-15,-16,-17,-18,-19,-20,-5,-12,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'CLASS_NAME':([5,7,23,24,25,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,62,96,100,102,126,143,147,149,157,160,164,165,166,167,168,182,201,203,204,205,206,207,210,211,213,214,],[10,10,57,57,57,57,-101,57,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-100,10,57,57,57,57,57,57,57,57,-113,-105,-106,-107,-108,-109,57,-112,-144,-144,57,-144,-144,57,57,57,57,]),'RELATION_NAME':([5,7,23,24,25,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,57,58,59,62,94,96,97,100,102,104,126,129,135,137,138,139,143,146,147,149,151,153,154,155,157,160,163,164,165,166,167,168,172,173,174,175,176,177,178,179,180,181,182,188,194,201,203,204,205,206,207,210,211,213,214,215,216,218,],[11,11,59,59,59,59,-101,59,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-100,-9,-10,-11,11,110,59,122,59,59,122,59,122,122,-39,-40,-41,59,122,59,59,122,-97,-98,-99,59,-113,192,-105,-106,-107,-108,-109,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,59,200,-71,-112,-144,-144,59,-144,-144,59,59,59,59,-104,-42,-103,]),'INSTANCE_NAME':([5,7,23,24,25,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,62,96,100,102,126,143,147,149,157,160,164,165,166,167,168,182,201,203,204,205,206,207,210,211,213,214,],[12,12,58,58,58,58,-101,58,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-100,12,58,58,58,58,58,58,58,58,-113,-105,-106,-107,-108,-109,58,-112,-144,-144,58,-144,-144,58,58,58,58,]),'GENSET':([6,10,11,12,14,15,16,17,18,19,20,21,22,26,50,52,53,54,56,57,58,59,63,90,91,92,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[-144,-6,-7,-8,-144,-83,-14,-15,-16,-17,-18,-19,-20,62,-144,-84,-85,-5,-144,-9,-10,-11,-144,-144,-82,-83,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'ENUM':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[24,-6,-7,-8,24,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'DATATYPE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[25,-6,-7,-8,25,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'AT':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,129,130,131,132,135,137,138,139,142,144,145,151,153,154,155,160,161,172,173,174,175,176,177,178,179,180,181,184,187,194,195,201,215,216,217,218,219,],[28,-6,-7,-8,28,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,141,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,156,-94,-33,-44,141,-39,-40,-41,-21,-64,-67,156,-97,-98,-99,-113,-35,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-93,-43,-71,-88,-112,-104,-42,-89,-103,-102,]),'ASSOCIATION_NAME':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[30,-6,-7,-8,30,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'EVENT':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,94,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[31,-6,-7,-8,31,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,115,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'SITUATION':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,94,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[32,-6,-7,-8,32,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,116,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'PROCESS':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[33,-6,-7,-8,33,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'CATEGORY':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[34,-6,-7,-8,34,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'MIXIN':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[35,-6,-7,-8,35,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'PHASEMIXIN':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[36,-6,-7,-8,36,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'ROLEMIXIN':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[37,-6,-7,-8,37,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'HISTORICALROLEMIXIN':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[38,-6,-7,-8,38,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'KIND':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[39,-6,-7,-8,39,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'COLLECTIVE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[40,-6,-7,-8,40,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'QUANTITY':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[41,-6,-7,-8,41,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'QUALITY':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,94,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[42,-6,-7,-8,42,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,113,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'MODE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,94,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[43,-6,-7,-8,43,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,114,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'INTRINSICMODE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,94,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[44,-6,-7,-8,44,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,111,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'EXTRINSICMODE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,94,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[45,-6,-7,-8,45,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,112,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'SUBKIND':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[46,-6,-7,-8,46,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'PHASE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[47,-6,-7,-8,47,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'ROLE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[48,-6,-7,-8,48,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'HISTORICALROLE':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[49,-6,-7,-8,49,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'RELATOR':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,90,93,94,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[51,-6,-7,-8,51,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,-144,-144,109,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'RELATION':([6,10,11,12,14,16,17,18,19,20,21,22,54,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[29,-6,-7,-8,29,-14,-15,-16,-17,-18,-19,-20,-5,-144,-9,-10,-11,-144,102,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'DISJOINT':([6,10,11,12,14,16,17,18,19,20,21,22,50,52,53,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[52,-6,-7,-8,52,-14,-15,-16,-17,-18,-19,-20,52,-84,-85,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'COMPLETE':([6,10,11,12,14,16,17,18,19,20,21,22,50,52,53,54,56,57,58,59,63,90,93,95,99,101,103,105,106,107,108,109,110,111,112,113,114,115,116,123,124,125,128,130,131,132,142,144,145,161,184,187,195,217,219,],[53,-6,-7,-8,53,-14,-15,-16,-17,-18,-19,-20,53,-84,-85,-5,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'WHERE':([10,11,12,98,],[-6,-7,-8,126,]),'LBRACE':([10,11,12,56,57,58,59,60,61,63,90,93,95,98,99,101,106,107,108,109,110,111,112,113,114,115,116,131,132,187,],[-6,-7,-8,-144,-9,-10,-11,96,97,-144,104,-144,-23,127,129,-34,104,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-44,-43,]),'MATERIAL':([28,141,156,],[65,65,65,]),'DERIVATION':([28,141,156,],[66,66,66,]),'COMPARATIVE':([28,141,156,],[67,67,67,]),'MEDIATION':([28,141,156,],[68,68,68,]),'CHARACTERIZATION':([28,141,156,],[69,69,69,]),'EXTERNALDEPENDENCE':([28,141,156,],[70,70,70,]),'COMPONENTOF':([28,141,156,],[71,71,71,]),'MEMBEROF':([28,141,156,],[72,72,72,]),'SUBCOLLECTIONOF':([28,141,156,],[73,73,73,]),'SUBQUALITYOF':([28,141,156,],[74,74,74,]),'INSTANTIATION':([28,141,156,],[75,75,75,]),'TERMINATION':([28,141,156,],[76,76,76,]),'PARTICIPATIONAL':([28,141,156,],[77,77,77,]),'PARTICIPATION':([28,141,156,],[78,78,78,]),'HISTORICALDEPENDENCE':([28,141,156,],[79,79,79,]),'CREATION':([28,141,156,],[80,80,80,]),'MANIFESTATION':([28,141,156,],[81,81,81,]),'BRINGSABOUT':([28,141,156,],[82,82,82,]),'TRIGGERS':([28,141,156,],[83,83,83,]),'COMPOSITION':([28,141,156,],[84,84,84,]),'AGGREGATION':([28,141,156,],[85,85,85,]),'INHERENCE':([28,141,156,],[86,86,86,]),'VALUE':([28,141,156,],[87,87,87,]),'FORMAL':([28,141,156,],[88,88,88,]),'CONSTITUTION':([28,141,156,],[89,89,89,]),'OF':([56,57,58,59,],[94,-9,-10,-11,]),'SPECIALIZES':([56,57,58,59,63,93,95,107,108,109,110,111,112,113,114,115,116,132,148,187,],[-144,-9,-10,-11,100,100,-23,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-44,182,-43,]),'COMMA':([57,58,59,117,120,131,132,148,160,172,173,174,175,176,177,178,179,180,181,183,187,194,201,212,],[-9,-10,-11,143,146,157,-44,157,-113,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,197,-43,-71,-112,157,]),'RBRACE':([57,58,59,97,104,117,118,119,120,121,129,132,134,135,136,137,138,139,146,150,151,152,153,154,155,160,162,170,171,172,173,174,175,176,177,178,179,180,181,185,187,194,201,212,215,216,218,],[-9,-10,-11,-144,-144,-66,144,145,-69,-70,-144,-44,161,-144,-38,-39,-40,-41,-144,184,-144,-96,-97,-98,-99,-113,-37,-65,-68,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-95,-43,-71,-112,217,-104,-42,-103,]),'LBRACKET':([57,58,59,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,133,164,165,166,167,168,169,172,173,174,175,176,177,178,179,180,181,186,203,204,206,207,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,159,-105,-106,-107,-108,-109,159,159,-72,-73,-74,-75,-76,-77,-78,-79,-80,159,159,159,159,159,]),'DOUBLE_HYPHEN':([57,58,59,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,104,129,133,135,136,137,138,139,140,151,152,153,154,155,158,160,169,172,173,174,175,176,177,178,179,180,181,186,192,193,194,199,200,201,215,216,218,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-111,-39,-40,-41,164,-144,-111,-97,-98,-99,164,-113,-110,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-110,164,164,-71,164,164,-112,-104,-42,-103,]),'ARROW_RL':([57,58,59,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,104,129,133,135,136,137,138,139,140,151,152,153,154,155,158,160,169,172,173,174,175,176,177,178,179,180,181,186,192,193,194,199,200,201,215,216,218,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-111,-39,-40,-41,165,-144,-111,-97,-98,-99,165,-113,-110,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-110,165,165,-71,165,165,-112,-104,-42,-103,]),'ARROW_LR':([57,58,59,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,104,129,133,135,136,137,138,139,140,151,152,153,154,155,158,160,169,172,173,174,175,176,177,178,179,180,181,186,192,193,194,199,200,201,215,216,218,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-111,-39,-40,-41,166,-144,-111,-97,-98,-99,166,-113,-110,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-110,166,166,-71,166,166,-112,-104,-42,-103,]),'ARROW_RL_COMPOSITION':([57,58,59,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,104,129,133,135,136,137,138,139,140,151,152,153,154,155,158,160,169,172,173,174,175,176,177,178,179,180,181,186,192,193,194,199,200,201,215,216,218,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-111,-39,-40,-41,167,-144,-111,-97,-98,-99,167,-113,-110,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-110,167,167,-71,167,167,-112,-104,-42,-103,]),'ARROW_RL_AGGREGATION':([57,58,59,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,104,129,133,135,136,137,138,139,140,151,152,153,154,155,158,160,169,172,173,174,175,176,177,178,179,180,181,186,192,193,194,199,200,201,215,216,218,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-111,-39,-40,-41,168,-144,-111,-97,-98,-99,168,-113,-110,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-110,168,168,-71,168,168,-112,-104,-42,-103,]),'SPECIFICS':([57,58,59,183,196,197,198,],[-9,-10,-11,-144,205,-90,-91,]),'FUNCTIONALCOMPLEXES':([94,],[108,]),'COLON':([122,],[147,]),'GENERAL':([127,],[149,]),'NUMBER_TYPE':([147,],[175,]),'STRING_TYPE':([147,],[176,]),'BOOLEAN_TYPE':([147,],[177,]),'DATE_TYPE':([147,],[178,]),'TIME_TYPE':([147,],[179,]),'DATETIME_TYPE':([147,],[180,]),'INT_TYPE':([147,],[181,]),'NUMBER':([159,202,],[190,208,]),'ASTERISK':([159,202,],[191,209,]),'RBRACKET':([189,190,191,208,209,],[201,-114,-115,-116,-117,]),'DOTDOT':([190,],[202,]),}
+_lr_action_items = {'PACKAGE':([0,2,3,5,11,12,13,14,],[-144,6,-3,-2,-6,-7,-8,-4,]),'IMPORT':([0,2,3,5,11,12,13,14,],[-144,7,-3,-2,-6,-7,-8,-4,]),'$end':([1,4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[0,-144,-1,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'ENUM':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,24,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'DATATYPE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,25,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'AT':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,126,127,128,129,131,132,133,134,136,141,142,146,147,148,149,150,151,157,158,159,160,161,162,163,164,165,166,169,170,171,172,173,175,187,188,194,210,212,213,214,215,],[-144,28,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-144,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-144,-94,-33,-44,153,-38,-21,-64,-67,174,-96,-113,-35,-37,-39,-40,-41,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-93,-95,-97,-98,-99,-43,-71,-88,-112,-89,-102,-104,-42,-103,]),'ASSOCIATION_NAME':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,30,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'EVENT':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,91,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,31,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,112,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'SITUATION':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,91,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,32,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,113,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'PROCESS':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,33,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'CATEGORY':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,34,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'MIXIN':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,35,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'PHASEMIXIN':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,36,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'ROLEMIXIN':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,37,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'HISTORICALROLEMIXIN':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,38,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'KIND':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,39,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'COLLECTIVE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,40,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'QUANTITY':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,41,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'QUALITY':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,91,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,42,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,110,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'MODE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,91,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,43,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,111,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'INTRINSICMODE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,91,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,44,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,108,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'EXTRINSICMODE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,91,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,45,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,109,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'SUBKIND':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,46,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'PHASE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,47,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'ROLE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,48,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'HISTORICALROLE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,49,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'RELATOR':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,89,90,91,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,51,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,-144,-144,106,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'RELATION':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,52,53,54,55,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,29,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,-144,-9,-10,-11,-144,99,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'GENSET':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,26,50,52,53,54,55,59,60,61,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,-144,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,58,-83,-144,-9,-10,-11,-82,-84,-85,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'DISJOINT':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,26,50,52,53,54,55,59,60,61,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,-144,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,60,-83,-144,-9,-10,-11,-82,-84,-85,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'COMPLETE':([4,8,9,10,11,12,13,15,16,17,18,19,20,21,22,26,50,52,53,54,55,59,60,61,62,89,90,92,96,98,100,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,125,127,128,129,133,134,136,147,169,175,188,210,212,],[-144,-144,-13,-5,-6,-7,-8,-12,-14,-15,-16,-17,-18,-19,-20,61,-83,-144,-9,-10,-11,-82,-84,-85,-144,-144,-144,-23,-144,-34,-118,-36,-144,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-81,-86,-87,-92,-94,-33,-44,-21,-64,-67,-35,-93,-43,-88,-89,-102,]),'CLASS_NAME':([6,7,23,24,25,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,58,93,97,99,123,135,138,140,143,146,167,177,178,179,180,181,194,198,200,203,204,206,207,208,209,211,],[11,11,53,53,53,53,-101,53,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-100,11,53,53,53,53,53,53,53,53,-113,53,-105,-106,-107,-108,-109,-112,53,-144,-144,-144,-144,53,53,53,53,]),'RELATION_NAME':([6,7,23,24,25,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,53,54,55,58,91,93,94,97,99,101,123,126,131,132,135,137,138,140,141,142,143,146,148,149,150,151,157,158,159,160,161,162,163,164,165,166,167,170,171,172,173,176,177,178,179,180,181,185,187,194,198,200,203,204,206,207,208,209,211,213,214,215,],[12,12,55,55,55,55,-101,55,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-100,-9,-10,-11,12,107,55,119,55,55,-144,55,-144,119,-38,55,119,55,55,119,-96,55,-113,-37,-39,-40,-41,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,55,-95,-97,-98,-99,193,-105,-106,-107,-108,-109,196,-71,-112,55,-144,-144,-144,-144,55,55,55,55,-104,-42,-103,]),'INSTANCE_NAME':([6,7,23,24,25,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,58,93,97,99,123,135,138,140,143,146,167,177,178,179,180,181,194,198,200,203,204,206,207,208,209,211,],[13,13,54,54,54,54,-101,54,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-100,13,54,54,54,54,54,54,54,54,-113,54,-105,-106,-107,-108,-109,-112,54,-144,-144,-144,-144,54,54,54,54,]),'WHERE':([11,12,13,95,],[-6,-7,-8,123,]),'LBRACE':([11,12,13,52,53,54,55,56,57,62,89,90,92,95,96,98,103,104,105,106,107,108,109,110,111,112,113,128,129,175,],[-6,-7,-8,-144,-9,-10,-11,93,94,-144,101,-144,-23,124,126,-34,101,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-44,-43,]),'MATERIAL':([28,153,174,],[64,64,64,]),'DERIVATION':([28,153,174,],[65,65,65,]),'COMPARATIVE':([28,153,174,],[66,66,66,]),'MEDIATION':([28,153,174,],[67,67,67,]),'CHARACTERIZATION':([28,153,174,],[68,68,68,]),'EXTERNALDEPENDENCE':([28,153,174,],[69,69,69,]),'COMPONENTOF':([28,153,174,],[70,70,70,]),'MEMBEROF':([28,153,174,],[71,71,71,]),'SUBCOLLECTIONOF':([28,153,174,],[72,72,72,]),'SUBQUALITYOF':([28,153,174,],[73,73,73,]),'INSTANTIATION':([28,153,174,],[74,74,74,]),'TERMINATION':([28,153,174,],[75,75,75,]),'PARTICIPATIONAL':([28,153,174,],[76,76,76,]),'PARTICIPATION':([28,153,174,],[77,77,77,]),'HISTORICALDEPENDENCE':([28,153,174,],[78,78,78,]),'CREATION':([28,153,174,],[79,79,79,]),'MANIFESTATION':([28,153,174,],[80,80,80,]),'BRINGSABOUT':([28,153,174,],[81,81,81,]),'TRIGGERS':([28,153,174,],[82,82,82,]),'COMPOSITION':([28,153,174,],[83,83,83,]),'AGGREGATION':([28,153,174,],[84,84,84,]),'INHERENCE':([28,153,174,],[85,85,85,]),'VALUE':([28,153,174,],[86,86,86,]),'FORMAL':([28,153,174,],[87,87,87,]),'CONSTITUTION':([28,153,174,],[88,88,88,]),'OF':([52,53,54,55,],[91,-9,-10,-11,]),'SPECIALIZES':([52,53,54,55,62,90,92,104,105,106,107,108,109,110,111,112,113,129,139,175,],[-144,-9,-10,-11,97,97,-23,-22,-24,-25,-26,-27,-28,-29,-30,-31,-32,-44,167,-43,]),'RBRACE':([53,54,55,94,101,114,115,116,117,118,126,129,131,132,141,142,146,148,149,150,151,155,156,157,158,159,160,161,162,163,164,165,166,170,171,172,173,175,187,194,205,213,214,215,],[-9,-10,-11,-144,-144,-66,134,136,-69,-70,-144,-44,147,-38,169,-96,-113,-37,-39,-40,-41,-65,-68,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-95,-97,-98,-99,-43,-71,-112,210,-104,-42,-103,]),'COMMA':([53,54,55,94,114,115,116,117,118,128,129,139,146,155,156,157,158,159,160,161,162,163,164,165,166,168,175,187,194,205,],[-9,-10,-11,-144,-66,135,137,-69,-70,143,-44,143,-113,-65,-68,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,190,-43,-71,-112,143,]),'LBRACKET':([53,54,55,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,130,157,158,159,160,161,162,163,164,165,166,177,178,179,180,181,186,192,200,203,204,206,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,145,145,-72,-73,-74,-75,-76,-77,-78,-79,-80,-105,-106,-107,-108,-109,145,145,145,145,145,145,]),'DOUBLE_HYPHEN':([53,54,55,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,101,126,130,131,132,141,142,144,146,148,149,150,151,152,154,157,158,159,160,161,162,163,164,165,166,170,171,172,173,186,187,192,193,194,196,197,199,213,214,215,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-38,-144,-96,177,-113,-37,-39,-40,-41,177,-111,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-95,-97,-98,-99,-110,-71,-110,177,-112,177,177,177,-104,-42,-103,]),'ARROW_RL':([53,54,55,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,101,126,130,131,132,141,142,144,146,148,149,150,151,152,154,157,158,159,160,161,162,163,164,165,166,170,171,172,173,186,187,192,193,194,196,197,199,213,214,215,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-38,-144,-96,178,-113,-37,-39,-40,-41,178,-111,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-95,-97,-98,-99,-110,-71,-110,178,-112,178,178,178,-104,-42,-103,]),'ARROW_LR':([53,54,55,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,101,126,130,131,132,141,142,144,146,148,149,150,151,152,154,157,158,159,160,161,162,163,164,165,166,170,171,172,173,186,187,192,193,194,196,197,199,213,214,215,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-38,-144,-96,179,-113,-37,-39,-40,-41,179,-111,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-95,-97,-98,-99,-110,-71,-110,179,-112,179,179,179,-104,-42,-103,]),'ARROW_RL_COMPOSITION':([53,54,55,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,101,126,130,131,132,141,142,144,146,148,149,150,151,152,154,157,158,159,160,161,162,163,164,165,166,170,171,172,173,186,187,192,193,194,196,197,199,213,214,215,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-38,-144,-96,180,-113,-37,-39,-40,-41,180,-111,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-95,-97,-98,-99,-110,-71,-110,180,-112,180,180,180,-104,-42,-103,]),'ARROW_RL_AGGREGATION':([53,54,55,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,101,126,130,131,132,141,142,144,146,148,149,150,151,152,154,157,158,159,160,161,162,163,164,165,166,170,171,172,173,186,187,192,193,194,196,197,199,213,214,215,],[-9,-10,-11,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-144,-144,-144,-38,-144,-96,181,-113,-37,-39,-40,-41,181,-111,-144,-72,-73,-74,-75,-76,-77,-78,-79,-80,-95,-97,-98,-99,-110,-71,-110,181,-112,181,181,181,-104,-42,-103,]),'SPECIFICS':([53,54,55,168,189,190,191,],[-9,-10,-11,-144,198,-90,-91,]),'FUNCTIONALCOMPLEXES':([91,],[105,]),'COLON':([119,],[138,]),'GENERAL':([124,],[140,]),'NUMBER_TYPE':([138,],[160,]),'STRING_TYPE':([138,],[161,]),'BOOLEAN_TYPE':([138,],[162,]),'DATE_TYPE':([138,],[163,]),'TIME_TYPE':([138,],[164,]),'DATETIME_TYPE':([138,],[165,]),'INT_TYPE':([138,],[166,]),'NUMBER':([145,195,],[183,201,]),'ASTERISK':([145,195,],[184,202,]),'RBRACKET':([182,183,184,201,202,],[194,-114,-115,-116,-117,]),'DOTDOT':([183,],[195,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'programa':([0,],[1,]),'pre_package_decls':([0,3,],[2,8,]),'declaracao_import':([0,3,],[3,3,]),'empty':([0,3,6,14,50,56,63,90,93,97,99,104,106,129,133,135,146,151,169,172,183,186,203,204,206,207,],[4,4,15,15,92,95,101,105,101,121,130,136,105,152,160,136,121,152,160,160,198,160,160,160,160,160,]),'declaracao_package':([2,],[6,]),'nome_identificador':([5,7,62,],[9,54,98,]),'declaracoes_pos_package':([6,14,],[13,55,]),'declaracao':([6,14,],[14,14,]),'declaracao_classe':([6,14,],[16,16,]),'declaracao_enum':([6,14,],[17,17,]),'declaracao_datatype':([6,14,],[18,18,]),'declaracao_genset':([6,14,],[19,19,]),'declaracao_relacao_externa':([6,14,],[20,20,]),'declaracao_relacao_inline':([6,14,],[21,21,]),'declaracao_association':([6,14,],[22,22,]),'estereotipo_classe':([6,14,],[23,23,]),'genset_modifiers':([6,14,50,],[26,26,91,]),'tipo_relacao_externa':([6,14,],[27,27,]),'genset_modifier':([6,14,50,],[50,50,50,]),'class_identifier':([23,24,25,27,30,96,100,102,126,143,147,149,157,182,205,210,211,213,214,],[56,60,61,63,90,117,132,133,132,117,174,183,187,195,132,215,216,218,219,]),'estereotipo_relacao':([28,141,156,],[64,169,186,]),'classe_natureza_opcional':([56,],[93,]),'classe_specialization':([63,93,],[99,106,]),'classe_body':([90,106,],[103,142,]),'natureza_classe':([94,],[107,]),'lista_individuos':([96,143,],[118,170,]),'lista_atributos_datatype':([97,146,],[119,171,]),'atributo_datatype':([97,104,129,135,146,151,],[120,137,154,137,120,154,]),'genset_form':([98,],[123,]),'genset_form_where':([98,],[124,]),'genset_form_block':([98,],[125,]),'relation_body':([99,],[128,]),'lista_nomes_classe':([100,126,205,],[131,148,212,]),'lista_membros_classe':([104,135,],[134,162,]),'membro_classe':([104,135,],[135,135,]),'declaracao_relacao_interna':([104,129,135,151,],[138,153,138,153,]),'classe_relation_internal':([104,135,],[139,139,]),'estereotipo_relacao_opcional':([104,129,135,151,],[140,140,140,140,]),'relation_members':([129,151,],[150,185,]),'relation_member':([129,151,],[151,151,]),'relacao_interna_relator':([129,151,],[155,155,]),'cardinalidade_opcional':([133,169,172,186,203,204,206,207,],[158,193,194,199,210,211,213,214,]),'seta':([140,158,192,193,199,200,],[163,188,203,204,206,207,]),'tipo_atributo':([147,],[172,]),'tipo_primitivo':([147,],[173,]),'cardinalidade_valor':([159,],[189,]),'maybe_comma':([183,],[196,]),}
+_lr_goto_items = {'programa':([0,],[1,]),'pre_package_decls':([0,],[2,]),'empty':([0,4,8,52,62,89,90,94,96,101,103,126,130,131,141,157,168,186,192,200,203,204,206,],[3,9,50,92,98,102,98,118,127,132,102,142,146,154,154,146,191,146,146,146,146,146,146,]),'declaracao_package':([2,],[4,]),'declaracao_import':([2,],[5,]),'declaracoes_pos_package':([4,],[8,]),'nome_identificador':([6,7,58,],[10,14,95,]),'declaracao':([8,],[15,]),'declaracao_classe':([8,],[16,]),'declaracao_enum':([8,],[17,]),'declaracao_datatype':([8,],[18,]),'declaracao_genset':([8,],[19,]),'declaracao_relacao_externa':([8,],[20,]),'declaracao_relacao_inline':([8,],[21,]),'declaracao_association':([8,],[22,]),'estereotipo_classe':([8,],[23,]),'genset_modifiers':([8,],[26,]),'tipo_relacao_externa':([8,],[27,]),'class_identifier':([23,24,25,27,30,93,97,99,123,135,138,140,143,167,198,207,208,209,211,],[52,56,57,62,89,114,129,130,129,155,159,168,175,188,129,212,213,214,215,]),'genset_modifier':([26,],[59,]),'estereotipo_relacao':([28,153,174,],[63,186,192,]),'classe_natureza_opcional':([52,],[90,]),'classe_specialization':([62,90,],[96,103,]),'classe_body':([89,103,],[100,133,]),'natureza_classe':([91,],[104,]),'lista_individuos':([93,],[115,]),'lista_atributos_datatype':([94,],[116,]),'atributo_datatype':([94,131,137,141,],[117,149,156,172,]),'genset_form':([95,],[120,]),'genset_form_where':([95,],[121,]),'genset_form_block':([95,],[122,]),'relation_body':([96,],[125,]),'lista_nomes_classe':([97,123,198,],[128,139,205,]),'lista_membros_classe':([101,],[131,]),'relation_members':([126,],[141,]),'cardinalidade_opcional':([130,157,186,192,200,203,204,206,],[144,187,197,199,207,208,209,211,]),'membro_classe':([131,],[148,]),'declaracao_relacao_interna':([131,141,],[150,171,]),'classe_relation_internal':([131,],[151,]),'estereotipo_relacao_opcional':([131,141,],[152,152,]),'tipo_atributo':([138,],[157,]),'tipo_primitivo':([138,],[158,]),'relation_member':([141,],[170,]),'relacao_interna_relator':([141,],[173,]),'seta':([144,152,193,196,197,199,],[176,185,200,203,204,206,]),'cardinalidade_valor':([145,],[182,]),'maybe_comma':([168,],[189,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,148 +27,148 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> programa","S'",1,None,None,None),
-  ('programa -> pre_package_decls declaracao_package declaracoes_pos_package','programa',3,'p_programa','parser.py',38),
-  ('pre_package_decls -> declaracao_import pre_package_decls','pre_package_decls',2,'p_pre_package_decls','parser.py',48),
-  ('pre_package_decls -> empty','pre_package_decls',1,'p_pre_package_decls','parser.py',49),
-  ('declaracao_import -> IMPORT nome_identificador','declaracao_import',2,'p_declaracao_import','parser.py',57),
-  ('declaracao_package -> PACKAGE nome_identificador','declaracao_package',2,'p_declaracao_package','parser.py',65),
-  ('nome_identificador -> CLASS_NAME','nome_identificador',1,'p_nome_identificador','parser.py',70),
-  ('nome_identificador -> RELATION_NAME','nome_identificador',1,'p_nome_identificador','parser.py',71),
-  ('nome_identificador -> INSTANCE_NAME','nome_identificador',1,'p_nome_identificador','parser.py',72),
-  ('class_identifier -> CLASS_NAME','class_identifier',1,'p_class_identifier','parser.py',79),
-  ('class_identifier -> INSTANCE_NAME','class_identifier',1,'p_class_identifier','parser.py',80),
-  ('class_identifier -> RELATION_NAME','class_identifier',1,'p_class_identifier','parser.py',81),
-  ('declaracoes_pos_package -> declaracao declaracoes_pos_package','declaracoes_pos_package',2,'p_declaracoes_pos_package','parser.py',89),
-  ('declaracoes_pos_package -> empty','declaracoes_pos_package',1,'p_declaracoes_pos_package','parser.py',90),
-  ('declaracao -> declaracao_classe','declaracao',1,'p_declaracao','parser.py',101),
-  ('declaracao -> declaracao_enum','declaracao',1,'p_declaracao','parser.py',102),
-  ('declaracao -> declaracao_datatype','declaracao',1,'p_declaracao','parser.py',103),
-  ('declaracao -> declaracao_genset','declaracao',1,'p_declaracao','parser.py',104),
-  ('declaracao -> declaracao_relacao_externa','declaracao',1,'p_declaracao','parser.py',105),
-  ('declaracao -> declaracao_relacao_inline','declaracao',1,'p_declaracao','parser.py',106),
-  ('declaracao -> declaracao_association','declaracao',1,'p_declaracao','parser.py',107),
-  ('declaracao_classe -> estereotipo_classe class_identifier classe_natureza_opcional classe_specialization classe_body','declaracao_classe',5,'p_declaracao_classe','parser.py',116),
-  ('classe_natureza_opcional -> OF natureza_classe','classe_natureza_opcional',2,'p_classe_natureza_opcional','parser.py',133),
-  ('classe_natureza_opcional -> empty','classe_natureza_opcional',1,'p_classe_natureza_opcional','parser.py',134),
-  ('natureza_classe -> FUNCTIONALCOMPLEXES','natureza_classe',1,'p_natureza_classe','parser.py',142),
-  ('natureza_classe -> RELATOR','natureza_classe',1,'p_natureza_classe','parser.py',143),
-  ('natureza_classe -> RELATION_NAME','natureza_classe',1,'p_natureza_classe','parser.py',144),
-  ('natureza_classe -> INTRINSICMODE','natureza_classe',1,'p_natureza_classe','parser.py',145),
-  ('natureza_classe -> EXTRINSICMODE','natureza_classe',1,'p_natureza_classe','parser.py',146),
-  ('natureza_classe -> QUALITY','natureza_classe',1,'p_natureza_classe','parser.py',147),
-  ('natureza_classe -> MODE','natureza_classe',1,'p_natureza_classe','parser.py',148),
-  ('natureza_classe -> EVENT','natureza_classe',1,'p_natureza_classe','parser.py',149),
-  ('natureza_classe -> SITUATION','natureza_classe',1,'p_natureza_classe','parser.py',150),
-  ('classe_specialization -> SPECIALIZES lista_nomes_classe','classe_specialization',2,'p_classe_specialization','parser.py',155),
-  ('classe_specialization -> empty','classe_specialization',1,'p_classe_specialization','parser.py',156),
-  ('classe_body -> LBRACE lista_membros_classe RBRACE','classe_body',3,'p_classe_body','parser.py',164),
-  ('classe_body -> empty','classe_body',1,'p_classe_body','parser.py',165),
-  ('lista_membros_classe -> membro_classe lista_membros_classe','lista_membros_classe',2,'p_lista_membros_classe','parser.py',173),
-  ('lista_membros_classe -> empty','lista_membros_classe',1,'p_lista_membros_classe','parser.py',174),
-  ('membro_classe -> atributo_datatype','membro_classe',1,'p_membro_classe','parser.py',182),
-  ('membro_classe -> declaracao_relacao_interna','membro_classe',1,'p_membro_classe','parser.py',183),
-  ('membro_classe -> classe_relation_internal','membro_classe',1,'p_membro_classe','parser.py',184),
-  ('classe_relation_internal -> AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifier','classe_relation_internal',6,'p_classe_relation_internal','parser.py',189),
-  ('lista_nomes_classe -> lista_nomes_classe COMMA class_identifier','lista_nomes_classe',3,'p_lista_nomes_classe','parser.py',202),
-  ('lista_nomes_classe -> class_identifier','lista_nomes_classe',1,'p_lista_nomes_classe','parser.py',203),
-  ('estereotipo_classe -> EVENT','estereotipo_classe',1,'p_estereotipo_classe_1','parser.py',215),
-  ('estereotipo_classe -> SITUATION','estereotipo_classe',1,'p_estereotipo_classe_2','parser.py',220),
-  ('estereotipo_classe -> PROCESS','estereotipo_classe',1,'p_estereotipo_classe_3','parser.py',225),
-  ('estereotipo_classe -> CATEGORY','estereotipo_classe',1,'p_estereotipo_classe_4','parser.py',230),
-  ('estereotipo_classe -> MIXIN','estereotipo_classe',1,'p_estereotipo_classe_5','parser.py',235),
-  ('estereotipo_classe -> PHASEMIXIN','estereotipo_classe',1,'p_estereotipo_classe_6','parser.py',240),
-  ('estereotipo_classe -> ROLEMIXIN','estereotipo_classe',1,'p_estereotipo_classe_7','parser.py',245),
-  ('estereotipo_classe -> HISTORICALROLEMIXIN','estereotipo_classe',1,'p_estereotipo_classe_8','parser.py',250),
-  ('estereotipo_classe -> KIND','estereotipo_classe',1,'p_estereotipo_classe_9','parser.py',255),
-  ('estereotipo_classe -> COLLECTIVE','estereotipo_classe',1,'p_estereotipo_classe_10','parser.py',260),
-  ('estereotipo_classe -> QUANTITY','estereotipo_classe',1,'p_estereotipo_classe_11','parser.py',265),
-  ('estereotipo_classe -> QUALITY','estereotipo_classe',1,'p_estereotipo_classe_12','parser.py',270),
-  ('estereotipo_classe -> MODE','estereotipo_classe',1,'p_estereotipo_classe_13','parser.py',275),
-  ('estereotipo_classe -> INTRINSICMODE','estereotipo_classe',1,'p_estereotipo_classe_14','parser.py',280),
-  ('estereotipo_classe -> EXTRINSICMODE','estereotipo_classe',1,'p_estereotipo_classe_15','parser.py',285),
-  ('estereotipo_classe -> SUBKIND','estereotipo_classe',1,'p_estereotipo_classe_16','parser.py',290),
-  ('estereotipo_classe -> PHASE','estereotipo_classe',1,'p_estereotipo_classe_17','parser.py',295),
-  ('estereotipo_classe -> ROLE','estereotipo_classe',1,'p_estereotipo_classe_18','parser.py',300),
-  ('estereotipo_classe -> HISTORICALROLE','estereotipo_classe',1,'p_estereotipo_classe_19','parser.py',305),
-  ('declaracao_enum -> ENUM class_identifier LBRACE lista_individuos RBRACE','declaracao_enum',5,'p_declaracao_enum','parser.py',314),
-  ('lista_individuos -> class_identifier COMMA lista_individuos','lista_individuos',3,'p_lista_individuos','parser.py',320),
-  ('lista_individuos -> class_identifier','lista_individuos',1,'p_lista_individuos','parser.py',321),
-  ('declaracao_datatype -> DATATYPE class_identifier LBRACE lista_atributos_datatype RBRACE','declaracao_datatype',5,'p_declaracao_datatype','parser.py',333),
-  ('lista_atributos_datatype -> atributo_datatype COMMA lista_atributos_datatype','lista_atributos_datatype',3,'p_lista_atributos_datatype','parser.py',338),
-  ('lista_atributos_datatype -> atributo_datatype','lista_atributos_datatype',1,'p_lista_atributos_datatype','parser.py',339),
-  ('lista_atributos_datatype -> empty','lista_atributos_datatype',1,'p_lista_atributos_datatype','parser.py',340),
-  ('atributo_datatype -> RELATION_NAME COLON tipo_atributo cardinalidade_opcional','atributo_datatype',4,'p_atributo_datatype','parser.py',350),
-  ('tipo_atributo -> tipo_primitivo','tipo_atributo',1,'p_tipo_atributo','parser.py',362),
-  ('tipo_atributo -> class_identifier','tipo_atributo',1,'p_tipo_atributo','parser.py',363),
-  ('tipo_primitivo -> NUMBER_TYPE','tipo_primitivo',1,'p_tipo_primitivo_1','parser.py',369),
-  ('tipo_primitivo -> STRING_TYPE','tipo_primitivo',1,'p_tipo_primitivo_2','parser.py',374),
-  ('tipo_primitivo -> BOOLEAN_TYPE','tipo_primitivo',1,'p_tipo_primitivo_3','parser.py',379),
-  ('tipo_primitivo -> DATE_TYPE','tipo_primitivo',1,'p_tipo_primitivo_4','parser.py',384),
-  ('tipo_primitivo -> TIME_TYPE','tipo_primitivo',1,'p_tipo_primitivo_5','parser.py',389),
-  ('tipo_primitivo -> DATETIME_TYPE','tipo_primitivo',1,'p_tipo_primitivo_6','parser.py',394),
-  ('tipo_primitivo -> INT_TYPE','tipo_primitivo',1,'p_tipo_primitivo_7','parser.py',399),
-  ('declaracao_genset -> genset_modifiers GENSET nome_identificador genset_form','declaracao_genset',4,'p_declaracao_genset','parser.py',408),
-  ('genset_modifiers -> genset_modifier genset_modifiers','genset_modifiers',2,'p_genset_modifiers','parser.py',420),
-  ('genset_modifiers -> empty','genset_modifiers',1,'p_genset_modifiers','parser.py',421),
-  ('genset_modifier -> DISJOINT','genset_modifier',1,'p_genset_modifier','parser.py',429),
-  ('genset_modifier -> COMPLETE','genset_modifier',1,'p_genset_modifier','parser.py',430),
-  ('genset_form -> genset_form_where','genset_form',1,'p_genset_form','parser.py',435),
-  ('genset_form -> genset_form_block','genset_form',1,'p_genset_form','parser.py',436),
-  ('genset_form_where -> WHERE lista_nomes_classe SPECIALIZES class_identifier','genset_form_where',4,'p_genset_form_where','parser.py',442),
-  ('genset_form_block -> LBRACE GENERAL class_identifier maybe_comma SPECIFICS lista_nomes_classe RBRACE','genset_form_block',7,'p_genset_form_block','parser.py',449),
-  ('maybe_comma -> COMMA','maybe_comma',1,'p_maybe_comma','parser.py',456),
-  ('maybe_comma -> empty','maybe_comma',1,'p_maybe_comma','parser.py',457),
-  ('declaracao_relacao_externa -> tipo_relacao_externa class_identifier classe_specialization relation_body','declaracao_relacao_externa',4,'p_declaracao_relacao_externa','parser.py',472),
-  ('relation_body -> LBRACE relation_members RBRACE','relation_body',3,'p_relation_body','parser.py',484),
-  ('relation_body -> empty','relation_body',1,'p_relation_body','parser.py',485),
-  ('relation_members -> relation_member relation_members','relation_members',2,'p_relation_members','parser.py',493),
-  ('relation_members -> empty','relation_members',1,'p_relation_members','parser.py',494),
-  ('relation_member -> declaracao_relacao_interna','relation_member',1,'p_relation_member','parser.py',502),
-  ('relation_member -> atributo_datatype','relation_member',1,'p_relation_member','parser.py',503),
-  ('relation_member -> relacao_interna_relator','relation_member',1,'p_relation_member','parser.py',504),
-  ('tipo_relacao_externa -> RELATOR','tipo_relacao_externa',1,'p_tipo_relacao_externa','parser.py',509),
-  ('tipo_relacao_externa -> RELATION','tipo_relacao_externa',1,'p_tipo_relacao_externa','parser.py',510),
-  ('declaracao_relacao_inline -> AT estereotipo_relacao RELATION class_identifier cardinalidade_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifier','declaracao_relacao_inline',10,'p_declaracao_relacao_inline_com_estereotipo','parser.py',515),
-  ('relacao_interna_relator -> AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifier','relacao_interna_relator',6,'p_relacao_interna_relator','parser.py',532),
-  ('declaracao_relacao_interna -> estereotipo_relacao_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifier','declaracao_relacao_interna',6,'p_declaracao_relacao_interna','parser.py',546),
-  ('seta -> DOUBLE_HYPHEN','seta',1,'p_seta','parser.py',558),
-  ('seta -> ARROW_RL','seta',1,'p_seta','parser.py',559),
-  ('seta -> ARROW_LR','seta',1,'p_seta','parser.py',560),
-  ('seta -> ARROW_RL_COMPOSITION','seta',1,'p_seta','parser.py',561),
-  ('seta -> ARROW_RL_AGGREGATION','seta',1,'p_seta','parser.py',562),
-  ('estereotipo_relacao_opcional -> AT estereotipo_relacao','estereotipo_relacao_opcional',2,'p_estereotipo_relacao_opcional','parser.py',568),
-  ('estereotipo_relacao_opcional -> empty','estereotipo_relacao_opcional',1,'p_estereotipo_relacao_opcional','parser.py',569),
-  ('cardinalidade_opcional -> LBRACKET cardinalidade_valor RBRACKET','cardinalidade_opcional',3,'p_cardinalidade_opcional','parser.py',577),
-  ('cardinalidade_opcional -> empty','cardinalidade_opcional',1,'p_cardinalidade_opcional','parser.py',578),
-  ('cardinalidade_valor -> NUMBER','cardinalidade_valor',1,'p_cardinalidade_valor','parser.py',586),
-  ('cardinalidade_valor -> ASTERISK','cardinalidade_valor',1,'p_cardinalidade_valor','parser.py',587),
-  ('cardinalidade_valor -> NUMBER DOTDOT NUMBER','cardinalidade_valor',3,'p_cardinalidade_valor','parser.py',588),
-  ('cardinalidade_valor -> NUMBER DOTDOT ASTERISK','cardinalidade_valor',3,'p_cardinalidade_valor','parser.py',589),
-  ('declaracao_association -> ASSOCIATION_NAME class_identifier classe_body','declaracao_association',3,'p_declaracao_association','parser.py',599),
-  ('estereotipo_relacao -> MATERIAL','estereotipo_relacao',1,'p_estereotipo_relacao_1','parser.py',605),
-  ('estereotipo_relacao -> DERIVATION','estereotipo_relacao',1,'p_estereotipo_relacao_2','parser.py',610),
-  ('estereotipo_relacao -> COMPARATIVE','estereotipo_relacao',1,'p_estereotipo_relacao_3','parser.py',615),
-  ('estereotipo_relacao -> MEDIATION','estereotipo_relacao',1,'p_estereotipo_relacao_4','parser.py',620),
-  ('estereotipo_relacao -> CHARACTERIZATION','estereotipo_relacao',1,'p_estereotipo_relacao_5','parser.py',625),
-  ('estereotipo_relacao -> EXTERNALDEPENDENCE','estereotipo_relacao',1,'p_estereotipo_relacao_6','parser.py',630),
-  ('estereotipo_relacao -> COMPONENTOF','estereotipo_relacao',1,'p_estereotipo_relacao_7','parser.py',635),
-  ('estereotipo_relacao -> MEMBEROF','estereotipo_relacao',1,'p_estereotipo_relacao_8','parser.py',640),
-  ('estereotipo_relacao -> SUBCOLLECTIONOF','estereotipo_relacao',1,'p_estereotipo_relacao_9','parser.py',645),
-  ('estereotipo_relacao -> SUBQUALITYOF','estereotipo_relacao',1,'p_estereotipo_relacao_10','parser.py',650),
-  ('estereotipo_relacao -> INSTANTIATION','estereotipo_relacao',1,'p_estereotipo_relacao_11','parser.py',655),
-  ('estereotipo_relacao -> TERMINATION','estereotipo_relacao',1,'p_estereotipo_relacao_12','parser.py',660),
-  ('estereotipo_relacao -> PARTICIPATIONAL','estereotipo_relacao',1,'p_estereotipo_relacao_13','parser.py',665),
-  ('estereotipo_relacao -> PARTICIPATION','estereotipo_relacao',1,'p_estereotipo_relacao_14','parser.py',670),
-  ('estereotipo_relacao -> HISTORICALDEPENDENCE','estereotipo_relacao',1,'p_estereotipo_relacao_15','parser.py',675),
-  ('estereotipo_relacao -> CREATION','estereotipo_relacao',1,'p_estereotipo_relacao_16','parser.py',680),
-  ('estereotipo_relacao -> MANIFESTATION','estereotipo_relacao',1,'p_estereotipo_relacao_17','parser.py',685),
-  ('estereotipo_relacao -> BRINGSABOUT','estereotipo_relacao',1,'p_estereotipo_relacao_18','parser.py',690),
-  ('estereotipo_relacao -> TRIGGERS','estereotipo_relacao',1,'p_estereotipo_relacao_19','parser.py',695),
-  ('estereotipo_relacao -> COMPOSITION','estereotipo_relacao',1,'p_estereotipo_relacao_20','parser.py',700),
-  ('estereotipo_relacao -> AGGREGATION','estereotipo_relacao',1,'p_estereotipo_relacao_21','parser.py',705),
-  ('estereotipo_relacao -> INHERENCE','estereotipo_relacao',1,'p_estereotipo_relacao_22','parser.py',710),
-  ('estereotipo_relacao -> VALUE','estereotipo_relacao',1,'p_estereotipo_relacao_23','parser.py',715),
-  ('estereotipo_relacao -> FORMAL','estereotipo_relacao',1,'p_estereotipo_relacao_24','parser.py',720),
-  ('estereotipo_relacao -> CONSTITUTION','estereotipo_relacao',1,'p_estereotipo_relacao_25','parser.py',725),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',733),
+  ('programa -> pre_package_decls declaracao_package declaracoes_pos_package','programa',3,'p_programa','parser.py',43),
+  ('pre_package_decls -> pre_package_decls declaracao_import','pre_package_decls',2,'p_pre_package_decls','parser.py',56),
+  ('pre_package_decls -> empty','pre_package_decls',1,'p_pre_package_decls','parser.py',57),
+  ('declaracao_import -> IMPORT nome_identificador','declaracao_import',2,'p_declaracao_import','parser.py',66),
+  ('declaracao_package -> PACKAGE nome_identificador','declaracao_package',2,'p_declaracao_package','parser.py',74),
+  ('nome_identificador -> CLASS_NAME','nome_identificador',1,'p_nome_identificador','parser.py',79),
+  ('nome_identificador -> RELATION_NAME','nome_identificador',1,'p_nome_identificador','parser.py',80),
+  ('nome_identificador -> INSTANCE_NAME','nome_identificador',1,'p_nome_identificador','parser.py',81),
+  ('class_identifier -> CLASS_NAME','class_identifier',1,'p_class_identifier','parser.py',88),
+  ('class_identifier -> INSTANCE_NAME','class_identifier',1,'p_class_identifier','parser.py',89),
+  ('class_identifier -> RELATION_NAME','class_identifier',1,'p_class_identifier','parser.py',90),
+  ('declaracoes_pos_package -> declaracoes_pos_package declaracao','declaracoes_pos_package',2,'p_declaracoes_pos_package','parser.py',98),
+  ('declaracoes_pos_package -> empty','declaracoes_pos_package',1,'p_declaracoes_pos_package','parser.py',99),
+  ('declaracao -> declaracao_classe','declaracao',1,'p_declaracao','parser.py',111),
+  ('declaracao -> declaracao_enum','declaracao',1,'p_declaracao','parser.py',112),
+  ('declaracao -> declaracao_datatype','declaracao',1,'p_declaracao','parser.py',113),
+  ('declaracao -> declaracao_genset','declaracao',1,'p_declaracao','parser.py',114),
+  ('declaracao -> declaracao_relacao_externa','declaracao',1,'p_declaracao','parser.py',115),
+  ('declaracao -> declaracao_relacao_inline','declaracao',1,'p_declaracao','parser.py',116),
+  ('declaracao -> declaracao_association','declaracao',1,'p_declaracao','parser.py',117),
+  ('declaracao_classe -> estereotipo_classe class_identifier classe_natureza_opcional classe_specialization classe_body','declaracao_classe',5,'p_declaracao_classe','parser.py',126),
+  ('classe_natureza_opcional -> OF natureza_classe','classe_natureza_opcional',2,'p_classe_natureza_opcional','parser.py',143),
+  ('classe_natureza_opcional -> empty','classe_natureza_opcional',1,'p_classe_natureza_opcional','parser.py',144),
+  ('natureza_classe -> FUNCTIONALCOMPLEXES','natureza_classe',1,'p_natureza_classe','parser.py',152),
+  ('natureza_classe -> RELATOR','natureza_classe',1,'p_natureza_classe','parser.py',153),
+  ('natureza_classe -> RELATION_NAME','natureza_classe',1,'p_natureza_classe','parser.py',154),
+  ('natureza_classe -> INTRINSICMODE','natureza_classe',1,'p_natureza_classe','parser.py',155),
+  ('natureza_classe -> EXTRINSICMODE','natureza_classe',1,'p_natureza_classe','parser.py',156),
+  ('natureza_classe -> QUALITY','natureza_classe',1,'p_natureza_classe','parser.py',157),
+  ('natureza_classe -> MODE','natureza_classe',1,'p_natureza_classe','parser.py',158),
+  ('natureza_classe -> EVENT','natureza_classe',1,'p_natureza_classe','parser.py',159),
+  ('natureza_classe -> SITUATION','natureza_classe',1,'p_natureza_classe','parser.py',160),
+  ('classe_specialization -> SPECIALIZES lista_nomes_classe','classe_specialization',2,'p_classe_specialization','parser.py',165),
+  ('classe_specialization -> empty','classe_specialization',1,'p_classe_specialization','parser.py',166),
+  ('classe_body -> LBRACE lista_membros_classe RBRACE','classe_body',3,'p_classe_body','parser.py',174),
+  ('classe_body -> empty','classe_body',1,'p_classe_body','parser.py',175),
+  ('lista_membros_classe -> lista_membros_classe membro_classe','lista_membros_classe',2,'p_lista_membros_classe','parser.py',183),
+  ('lista_membros_classe -> empty','lista_membros_classe',1,'p_lista_membros_classe','parser.py',184),
+  ('membro_classe -> atributo_datatype','membro_classe',1,'p_membro_classe','parser.py',193),
+  ('membro_classe -> declaracao_relacao_interna','membro_classe',1,'p_membro_classe','parser.py',194),
+  ('membro_classe -> classe_relation_internal','membro_classe',1,'p_membro_classe','parser.py',195),
+  ('classe_relation_internal -> AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifier','classe_relation_internal',6,'p_classe_relation_internal','parser.py',200),
+  ('lista_nomes_classe -> lista_nomes_classe COMMA class_identifier','lista_nomes_classe',3,'p_lista_nomes_classe','parser.py',213),
+  ('lista_nomes_classe -> class_identifier','lista_nomes_classe',1,'p_lista_nomes_classe','parser.py',214),
+  ('estereotipo_classe -> EVENT','estereotipo_classe',1,'p_estereotipo_classe','parser.py',229),
+  ('estereotipo_classe -> SITUATION','estereotipo_classe',1,'p_estereotipo_classe','parser.py',230),
+  ('estereotipo_classe -> PROCESS','estereotipo_classe',1,'p_estereotipo_classe','parser.py',231),
+  ('estereotipo_classe -> CATEGORY','estereotipo_classe',1,'p_estereotipo_classe','parser.py',232),
+  ('estereotipo_classe -> MIXIN','estereotipo_classe',1,'p_estereotipo_classe','parser.py',233),
+  ('estereotipo_classe -> PHASEMIXIN','estereotipo_classe',1,'p_estereotipo_classe','parser.py',234),
+  ('estereotipo_classe -> ROLEMIXIN','estereotipo_classe',1,'p_estereotipo_classe','parser.py',235),
+  ('estereotipo_classe -> HISTORICALROLEMIXIN','estereotipo_classe',1,'p_estereotipo_classe','parser.py',236),
+  ('estereotipo_classe -> KIND','estereotipo_classe',1,'p_estereotipo_classe','parser.py',237),
+  ('estereotipo_classe -> COLLECTIVE','estereotipo_classe',1,'p_estereotipo_classe','parser.py',238),
+  ('estereotipo_classe -> QUANTITY','estereotipo_classe',1,'p_estereotipo_classe','parser.py',239),
+  ('estereotipo_classe -> QUALITY','estereotipo_classe',1,'p_estereotipo_classe','parser.py',240),
+  ('estereotipo_classe -> MODE','estereotipo_classe',1,'p_estereotipo_classe','parser.py',241),
+  ('estereotipo_classe -> INTRINSICMODE','estereotipo_classe',1,'p_estereotipo_classe','parser.py',242),
+  ('estereotipo_classe -> EXTRINSICMODE','estereotipo_classe',1,'p_estereotipo_classe','parser.py',243),
+  ('estereotipo_classe -> SUBKIND','estereotipo_classe',1,'p_estereotipo_classe','parser.py',244),
+  ('estereotipo_classe -> PHASE','estereotipo_classe',1,'p_estereotipo_classe','parser.py',245),
+  ('estereotipo_classe -> ROLE','estereotipo_classe',1,'p_estereotipo_classe','parser.py',246),
+  ('estereotipo_classe -> HISTORICALROLE','estereotipo_classe',1,'p_estereotipo_classe','parser.py',247),
+  ('declaracao_enum -> ENUM class_identifier LBRACE lista_individuos RBRACE','declaracao_enum',5,'p_declaracao_enum','parser.py',257),
+  ('lista_individuos -> lista_individuos COMMA class_identifier','lista_individuos',3,'p_lista_individuos','parser.py',263),
+  ('lista_individuos -> class_identifier','lista_individuos',1,'p_lista_individuos','parser.py',264),
+  ('declaracao_datatype -> DATATYPE class_identifier LBRACE lista_atributos_datatype RBRACE','declaracao_datatype',5,'p_declaracao_datatype','parser.py',277),
+  ('lista_atributos_datatype -> lista_atributos_datatype COMMA atributo_datatype','lista_atributos_datatype',3,'p_lista_atributos_datatype','parser.py',282),
+  ('lista_atributos_datatype -> atributo_datatype','lista_atributos_datatype',1,'p_lista_atributos_datatype','parser.py',283),
+  ('lista_atributos_datatype -> empty','lista_atributos_datatype',1,'p_lista_atributos_datatype','parser.py',284),
+  ('atributo_datatype -> RELATION_NAME COLON tipo_atributo cardinalidade_opcional','atributo_datatype',4,'p_atributo_datatype','parser.py',295),
+  ('tipo_atributo -> tipo_primitivo','tipo_atributo',1,'p_tipo_atributo','parser.py',307),
+  ('tipo_atributo -> class_identifier','tipo_atributo',1,'p_tipo_atributo','parser.py',308),
+  ('tipo_primitivo -> NUMBER_TYPE','tipo_primitivo',1,'p_tipo_primitivo','parser.py',314),
+  ('tipo_primitivo -> STRING_TYPE','tipo_primitivo',1,'p_tipo_primitivo','parser.py',315),
+  ('tipo_primitivo -> BOOLEAN_TYPE','tipo_primitivo',1,'p_tipo_primitivo','parser.py',316),
+  ('tipo_primitivo -> DATE_TYPE','tipo_primitivo',1,'p_tipo_primitivo','parser.py',317),
+  ('tipo_primitivo -> TIME_TYPE','tipo_primitivo',1,'p_tipo_primitivo','parser.py',318),
+  ('tipo_primitivo -> DATETIME_TYPE','tipo_primitivo',1,'p_tipo_primitivo','parser.py',319),
+  ('tipo_primitivo -> INT_TYPE','tipo_primitivo',1,'p_tipo_primitivo','parser.py',320),
+  ('declaracao_genset -> genset_modifiers GENSET nome_identificador genset_form','declaracao_genset',4,'p_declaracao_genset','parser.py',330),
+  ('genset_modifiers -> genset_modifiers genset_modifier','genset_modifiers',2,'p_genset_modifiers','parser.py',342),
+  ('genset_modifiers -> empty','genset_modifiers',1,'p_genset_modifiers','parser.py',343),
+  ('genset_modifier -> DISJOINT','genset_modifier',1,'p_genset_modifier','parser.py',352),
+  ('genset_modifier -> COMPLETE','genset_modifier',1,'p_genset_modifier','parser.py',353),
+  ('genset_form -> genset_form_where','genset_form',1,'p_genset_form','parser.py',358),
+  ('genset_form -> genset_form_block','genset_form',1,'p_genset_form','parser.py',359),
+  ('genset_form_where -> WHERE lista_nomes_classe SPECIALIZES class_identifier','genset_form_where',4,'p_genset_form_where','parser.py',365),
+  ('genset_form_block -> LBRACE GENERAL class_identifier maybe_comma SPECIFICS lista_nomes_classe RBRACE','genset_form_block',7,'p_genset_form_block','parser.py',372),
+  ('maybe_comma -> COMMA','maybe_comma',1,'p_maybe_comma','parser.py',379),
+  ('maybe_comma -> empty','maybe_comma',1,'p_maybe_comma','parser.py',380),
+  ('declaracao_relacao_externa -> tipo_relacao_externa class_identifier classe_specialization relation_body','declaracao_relacao_externa',4,'p_declaracao_relacao_externa','parser.py',395),
+  ('relation_body -> LBRACE relation_members RBRACE','relation_body',3,'p_relation_body','parser.py',407),
+  ('relation_body -> empty','relation_body',1,'p_relation_body','parser.py',408),
+  ('relation_members -> relation_members relation_member','relation_members',2,'p_relation_members','parser.py',416),
+  ('relation_members -> empty','relation_members',1,'p_relation_members','parser.py',417),
+  ('relation_member -> declaracao_relacao_interna','relation_member',1,'p_relation_member','parser.py',426),
+  ('relation_member -> atributo_datatype','relation_member',1,'p_relation_member','parser.py',427),
+  ('relation_member -> relacao_interna_relator','relation_member',1,'p_relation_member','parser.py',428),
+  ('tipo_relacao_externa -> RELATOR','tipo_relacao_externa',1,'p_tipo_relacao_externa','parser.py',433),
+  ('tipo_relacao_externa -> RELATION','tipo_relacao_externa',1,'p_tipo_relacao_externa','parser.py',434),
+  ('declaracao_relacao_inline -> AT estereotipo_relacao RELATION class_identifier cardinalidade_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifier','declaracao_relacao_inline',10,'p_declaracao_relacao_inline_com_estereotipo','parser.py',439),
+  ('relacao_interna_relator -> AT estereotipo_relacao cardinalidade_opcional seta cardinalidade_opcional class_identifier','relacao_interna_relator',6,'p_relacao_interna_relator','parser.py',456),
+  ('declaracao_relacao_interna -> estereotipo_relacao_opcional seta RELATION_NAME seta cardinalidade_opcional class_identifier','declaracao_relacao_interna',6,'p_declaracao_relacao_interna','parser.py',470),
+  ('seta -> DOUBLE_HYPHEN','seta',1,'p_seta','parser.py',482),
+  ('seta -> ARROW_RL','seta',1,'p_seta','parser.py',483),
+  ('seta -> ARROW_LR','seta',1,'p_seta','parser.py',484),
+  ('seta -> ARROW_RL_COMPOSITION','seta',1,'p_seta','parser.py',485),
+  ('seta -> ARROW_RL_AGGREGATION','seta',1,'p_seta','parser.py',486),
+  ('estereotipo_relacao_opcional -> AT estereotipo_relacao','estereotipo_relacao_opcional',2,'p_estereotipo_relacao_opcional','parser.py',492),
+  ('estereotipo_relacao_opcional -> empty','estereotipo_relacao_opcional',1,'p_estereotipo_relacao_opcional','parser.py',493),
+  ('cardinalidade_opcional -> LBRACKET cardinalidade_valor RBRACKET','cardinalidade_opcional',3,'p_cardinalidade_opcional','parser.py',501),
+  ('cardinalidade_opcional -> empty','cardinalidade_opcional',1,'p_cardinalidade_opcional','parser.py',502),
+  ('cardinalidade_valor -> NUMBER','cardinalidade_valor',1,'p_cardinalidade_valor','parser.py',510),
+  ('cardinalidade_valor -> ASTERISK','cardinalidade_valor',1,'p_cardinalidade_valor','parser.py',511),
+  ('cardinalidade_valor -> NUMBER DOTDOT NUMBER','cardinalidade_valor',3,'p_cardinalidade_valor','parser.py',512),
+  ('cardinalidade_valor -> NUMBER DOTDOT ASTERISK','cardinalidade_valor',3,'p_cardinalidade_valor','parser.py',513),
+  ('declaracao_association -> ASSOCIATION_NAME class_identifier classe_body','declaracao_association',3,'p_declaracao_association','parser.py',523),
+  ('estereotipo_relacao -> MATERIAL','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',529),
+  ('estereotipo_relacao -> DERIVATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',530),
+  ('estereotipo_relacao -> COMPARATIVE','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',531),
+  ('estereotipo_relacao -> MEDIATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',532),
+  ('estereotipo_relacao -> CHARACTERIZATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',533),
+  ('estereotipo_relacao -> EXTERNALDEPENDENCE','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',534),
+  ('estereotipo_relacao -> COMPONENTOF','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',535),
+  ('estereotipo_relacao -> MEMBEROF','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',536),
+  ('estereotipo_relacao -> SUBCOLLECTIONOF','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',537),
+  ('estereotipo_relacao -> SUBQUALITYOF','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',538),
+  ('estereotipo_relacao -> INSTANTIATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',539),
+  ('estereotipo_relacao -> TERMINATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',540),
+  ('estereotipo_relacao -> PARTICIPATIONAL','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',541),
+  ('estereotipo_relacao -> PARTICIPATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',542),
+  ('estereotipo_relacao -> HISTORICALDEPENDENCE','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',543),
+  ('estereotipo_relacao -> CREATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',544),
+  ('estereotipo_relacao -> MANIFESTATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',545),
+  ('estereotipo_relacao -> BRINGSABOUT','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',546),
+  ('estereotipo_relacao -> TRIGGERS','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',547),
+  ('estereotipo_relacao -> COMPOSITION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',548),
+  ('estereotipo_relacao -> AGGREGATION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',549),
+  ('estereotipo_relacao -> INHERENCE','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',550),
+  ('estereotipo_relacao -> VALUE','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',551),
+  ('estereotipo_relacao -> FORMAL','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',552),
+  ('estereotipo_relacao -> CONSTITUTION','estereotipo_relacao',1,'p_estereotipo_relacao','parser.py',553),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',562),
 ]
@@ -0,0 +1,548 @@
+"""
+Parser descendente recursivo para TONTO.
+
+Produz exatamente a mesma AST (dicts) que o front-end LALR do PLY em
+parser/parser.py, mas despacha cada construção por chamadas de método
+diretas com lookahead de até dois tokens — sem o interpretador de tabelas
+do yacc nem os trampolins 'p[0] = p[1]' por redução.
+
+Sobre a representação dos nós: dicts são o formato de intercâmbio da AST
+em todo o projeto — semantic.py e o relatório amigável leem tudo via
+.get() com defaults (tolerando campos ausentes entre variantes de nó) e o
+debug via json.dumps em main.py depende de nós serializáveis. Classes com
+__slots__ economizariam memória por nó, mas exigiriam reescrever os dois
+back-ends e todos os consumidores e perderiam essa flexibilidade; a
+economia de alocação ficou no caminho quente de verdade, o léxico
+(namedtuple Token em vez de LexToken).
+"""
+
+from lexer.lexer import tokenize
+
+# Conjuntos de despacho (espelham as produções da gramática do PLY)
+CLASS_STEREOTYPES = frozenset(
+    {
+        "EVENT",
+        "SITUATION",
+        "PROCESS",
+        "CATEGORY",
+        "MIXIN",
+        "PHASEMIXIN",
+        "ROLEMIXIN",
+        "HISTORICALROLEMIXIN",
+        "KIND",
+        "COLLECTIVE",
+        "QUANTITY",
+        "QUALITY",
+        "MODE",
+        "INTRINSICMODE",
+        "EXTRINSICMODE",
+        "SUBKIND",
+        "PHASE",
+        "ROLE",
+        "HISTORICALROLE",
+    }
+)
+
+RELATION_STEREOTYPES = frozenset(
+    {
+        "MATERIAL",
+        "DERIVATION",
+        "COMPARATIVE",
+        "MEDIATION",
+        "CHARACTERIZATION",
+        "EXTERNALDEPENDENCE",
+        "COMPONENTOF",
+        "MEMBEROF",
+        "SUBCOLLECTIONOF",
+        "SUBQUALITYOF",
+        "INSTANTIATION",
+        "TERMINATION",
+        "PARTICIPATIONAL",
+        "PARTICIPATION",
+        "HISTORICALDEPENDENCE",
+        "CREATION",
+        "MANIFESTATION",
+        "BRINGSABOUT",
+        "TRIGGERS",
+        "COMPOSITION",
+        "AGGREGATION",
+        "INHERENCE",
+        "VALUE",
+        "FORMAL",
+        "CONSTITUTION",
+    }
+)
+
+ARROWS = frozenset(
+    {
+        "DOUBLE_HYPHEN",
+        "ARROW_RL",
+        "ARROW_LR",
+        "ARROW_RL_COMPOSITION",
+        "ARROW_RL_AGGREGATION",
+    }
+)
+
+CLASS_IDENTIFIERS = frozenset({"CLASS_NAME", "INSTANCE_NAME", "RELATION_NAME"})
+
+NATUREZA_CLASSE = frozenset(
+    {
+        "FUNCTIONALCOMPLEXES",
+        "RELATOR",
+        "RELATION_NAME",
+        "INTRINSICMODE",
+        "EXTRINSICMODE",
+        "QUALITY",
+        "MODE",
+        "EVENT",
+        "SITUATION",
+    }
+)
+
+TIPOS_PRIMITIVOS = frozenset(
+    {
+        "NUMBER_TYPE",
+        "STRING_TYPE",
+        "BOOLEAN_TYPE",
+        "DATE_TYPE",
+        "TIME_TYPE",
+        "DATETIME_TYPE",
+        "INT_TYPE",
+    }
+)
+
+
+class _SyntaxAbort(Exception):
+    """Sinaliza erro sintático já reportado; desenrola até parse()."""
+
+
+class RecursiveDescentParser:
+    """
+    Um método por não-terminal; cada método devolve o nó de AST pronto.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.n = len(tokens)
+
+    # ------------------------------------------------------------------
+    # Utilitários
+    # ------------------------------------------------------------------
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i] if i < self.n else None
+
+    def advance(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def error(self, tok):
+        """Mesmo formato de mensagem do p_error do PLY."""
+        if tok:
+            print(
+                f"\n[ERRO SINTÁTICO] Token inesperado: {tok.type} ('{tok.value}') na linha {tok.lineno}"
+            )
+        else:
+            print(
+                "\n[ERRO SINTÁTICO] Fim de arquivo inesperado (EOF). O código está incompleto."
+            )
+        raise _SyntaxAbort()
+
+    def expect(self, token_type):
+        tok = self.peek()
+        if tok is None or tok.type != token_type:
+            self.error(tok)
+        return self.advance()
+
+    # ------------------------------------------------------------------
+    # programa : pre_package_decls declaracao_package declaracoes_pos_package
+    # ------------------------------------------------------------------
+    def parse_programa(self):
+        # As declarações são materializadas numa lista, e não emitidas por
+        # um generator: a AST completa é percorrida mais de uma vez a
+        # jusante (relatório sintático, build_symbol_table e a varredura de
+        # relações materiais do relator checker), então streaming obrigaria
+        # a re-parsear ou a bufferizar de qualquer forma. O pico de memória
+        # é O(declarações), modesto para fontes TONTO reais.
+        imports = []
+        while self.peek() is not None and self.peek().type == "IMPORT":
+            self.advance()
+            imports.append(
+                {"type": "Import", "target": self.parse_nome_identificador()}
+            )
+
+        self.expect("PACKAGE")
+        package = {"type": "Package", "name": self.parse_nome_identificador()}
+
+        declarations = []
+        while self.peek() is not None:
+            declarations.append(self.parse_declaracao())
+
+        return {
+            "type": "OntologyModel",
+            "imports": imports,
+            "package": package,
+            "declarations": declarations,
+        }
+
+    def parse_nome_identificador(self):
+        tok = self.peek()
+        if tok is None or tok.type not in CLASS_IDENTIFIERS:
+            self.error(tok)
+        return self.advance().value
+
+    parse_class_identifier = parse_nome_identificador
+
+    # ------------------------------------------------------------------
+    # Hub de declarações (despacho por tipo do primeiro token)
+    # ------------------------------------------------------------------
+    def parse_declaracao(self):
+        tok = self.peek()
+        ttype = tok.type
+        if ttype in CLASS_STEREOTYPES:
+            return self.parse_declaracao_classe()
+        if ttype == "ENUM":
+            return self.parse_declaracao_enum()
+        if ttype == "DATATYPE":
+            return self.parse_declaracao_datatype()
+        if ttype in ("GENSET", "DISJOINT", "COMPLETE"):
+            return self.parse_declaracao_genset()
+        if ttype in ("RELATOR", "RELATION"):
+            return self.parse_declaracao_relacao_externa()
+        if ttype == "AT":
+            return self.parse_declaracao_relacao_inline()
+        if ttype == "ASSOCIATION_NAME":
+            return self.parse_declaracao_association()
+        self.error(tok)
+
+    # ------------------------------------------------------------------
+    # Classes
+    # ------------------------------------------------------------------
+    def parse_declaracao_classe(self):
+        stereotype = self.advance().value
+
+        name_tok = self.peek()
+        if name_tok is None or name_tok.type not in CLASS_IDENTIFIERS:
+            self.error(name_tok)
+        self.advance()
+
+        nature = None
+        tok = self.peek()
+        if tok is not None and tok.type == "OF":
+            self.advance()
+            nat_tok = self.peek()
+            if nat_tok is None or nat_tok.type not in NATUREZA_CLASSE:
+                self.error(nat_tok)
+            nature = self.advance().value
+
+        specializes = self.parse_classe_specialization()
+        body = self.parse_classe_body()
+
+        return {
+            "type": "ClassDeclaration",
+            "stereotype": stereotype,
+            "name": name_tok.value,
+            "nature": nature,
+            "specializes": specializes,
+            "body": body,
+            "lineno": name_tok.lineno,
+        }
+
+    def parse_classe_specialization(self):
+        tok = self.peek()
+        if tok is None or tok.type != "SPECIALIZES":
+            return []
+        self.advance()
+        return self.parse_lista_nomes_classe()
+
+    def parse_lista_nomes_classe(self):
+        names = [self.parse_class_identifier()]
+        while self.peek() is not None and self.peek().type == "COMMA":
+            self.advance()
+            names.append(self.parse_class_identifier())
+        return names
+
+    def parse_classe_body(self):
+        tok = self.peek()
+        if tok is None or tok.type != "LBRACE":
+            return None
+        self.advance()
+        members = []
+        while self.peek() is not None and self.peek().type != "RBRACE":
+            members.append(self.parse_membro_classe())
+        self.expect("RBRACE")
+        return {"type": "ClassBody", "members": members}
+
+    def parse_membro_classe(self):
+        return self.parse_membro(internal_pole_has_lineno=False)
+
+    # ------------------------------------------------------------------
+    # Membros (compartilhados entre corpos de classe e de relator)
+    # ------------------------------------------------------------------
+    def parse_membro(self, internal_pole_has_lineno):
+        tok = self.peek()
+
+        # atributo: RELATION_NAME ':' tipo [card]
+        nxt = self.peek(1)
+        if (
+            tok.type == "RELATION_NAME"
+            and nxt is not None
+            and nxt.type == "COLON"
+        ):
+            return self.parse_atributo_datatype()
+
+        if tok.type == "AT":
+            at_tok = self.advance()
+            stereo_tok = self.peek()
+            if stereo_tok is None or stereo_tok.type not in RELATION_STEREOTYPES:
+                self.error(stereo_tok)
+            stereotype = self.advance().value
+
+            # '@estereotipo -- nome -- ...' é um polo nomeado (RelationPole);
+            # '@estereotipo [card] -- [card] Alvo' é o polo interno.
+            if self.peek() is not None and self.peek().type in ARROWS:
+                after = self.peek(1)
+                if (
+                    after is not None
+                    and after.type == "RELATION_NAME"
+                    and self.peek(2) is not None
+                    and self.peek(2).type in ARROWS
+                ):
+                    return self.parse_relacao_nomeada(stereotype)
+
+            left_card = self.parse_cardinalidade_opcional()
+            arrow = self.parse_seta()
+            right_card = self.parse_cardinalidade_opcional()
+            target = self.parse_class_identifier()
+
+            if internal_pole_has_lineno:
+                return {
+                    "type": "InternalRelationPole",
+                    "stereotype": stereotype,
+                    "left_cardinality": left_card,
+                    "arrow": arrow,
+                    "right_cardinality": right_card,
+                    "target_class": target,
+                    "lineno": at_tok.lineno,
+                }
+            return {
+                "type": "InternalRelation",
+                "stereotype": stereotype,
+                "left_cardinality": left_card,
+                "arrow": arrow,
+                "right_cardinality": right_card,
+                "target_class": target,
+            }
+
+        if tok.type in ARROWS:
+            return self.parse_relacao_nomeada(None)
+
+        self.error(tok)
+
+    def parse_relacao_nomeada(self, stereotype):
+        """declaracao_relacao_interna : [@estereotipo] seta RELATION_NAME seta [card] alvo"""
+        self.parse_seta()
+        name_tok = self.expect("RELATION_NAME")
+        self.parse_seta()
+        cardinality = self.parse_cardinalidade_opcional()
+        target = self.parse_class_identifier()
+        return {
+            "type": "RelationPole",
+            "stereotype": stereotype,
+            "name": name_tok.value,
+            "cardinality": cardinality,
+            "target_class": target,
+            "lineno": name_tok.lineno,
+        }
+
+    def parse_seta(self):
+        tok = self.peek()
+        if tok is None or tok.type not in ARROWS:
+            self.error(tok)
+        return self.advance().value
+
+    def parse_cardinalidade_opcional(self):
+        tok = self.peek()
+        if tok is None or tok.type != "LBRACKET":
+            return None
+        self.advance()
+        value = self.parse_cardinalidade_valor()
+        self.expect("RBRACKET")
+        return value
+
+    def parse_cardinalidade_valor(self):
+        tok = self.peek()
+        if tok is None:
+            self.error(tok)
+        if tok.type == "ASTERISK":
+            self.advance()
+            return "*"
+        first = self.expect("NUMBER").value
+        if self.peek() is not None and self.peek().type == "DOTDOT":
+            self.advance()
+            tok = self.peek()
+            if tok is not None and tok.type == "ASTERISK":
+                self.advance()
+                return f"{first}..*"
+            second = self.expect("NUMBER").value
+            return f"{first}..{second}"
+        return str(first)
+
+    # ------------------------------------------------------------------
+    # Atributos e datatypes
+    # ------------------------------------------------------------------
+    def parse_atributo_datatype(self):
+        name = self.expect("RELATION_NAME").value
+        self.expect("COLON")
+        tok = self.peek()
+        if tok is not None and tok.type in TIPOS_PRIMITIVOS:
+            datatype = self.advance().value
+        else:
+            datatype = self.parse_class_identifier()
+        cardinality = self.parse_cardinalidade_opcional()
+        return {
+            "type": "Attribute",
+            "name": name,
+            "datatype": datatype,
+            "cardinality": cardinality,
+        }
+
+    def parse_declaracao_datatype(self):
+        self.advance()  # DATATYPE
+        name = self.parse_class_identifier()
+        self.expect("LBRACE")
+        attributes = []
+        if self.peek() is not None and self.peek().type != "RBRACE":
+            attributes.append(self.parse_atributo_datatype())
+            while self.peek() is not None and self.peek().type == "COMMA":
+                self.advance()
+                attributes.append(self.parse_atributo_datatype())
+        self.expect("RBRACE")
+        return {"type": "DataTypeDeclaration", "name": name, "attributes": attributes}
+
+    # ------------------------------------------------------------------
+    # Enum
+    # ------------------------------------------------------------------
+    def parse_declaracao_enum(self):
+        self.advance()  # ENUM
+        name = self.parse_class_identifier()
+        self.expect("LBRACE")
+        members = [self.parse_class_identifier()]
+        while self.peek() is not None and self.peek().type == "COMMA":
+            self.advance()
+            members.append(self.parse_class_identifier())
+        self.expect("RBRACE")
+        return {"type": "EnumDeclaration", "name": name, "members": members}
+
+    # ------------------------------------------------------------------
+    # Genset
+    # ------------------------------------------------------------------
+    def parse_declaracao_genset(self):
+        modifiers = []
+        while self.peek() is not None and self.peek().type in ("DISJOINT", "COMPLETE"):
+            modifiers.append(self.advance().value)
+
+        genset_tok = self.expect("GENSET")
+        name = self.parse_nome_identificador()
+
+        tok = self.peek()
+        if tok is not None and tok.type == "WHERE":
+            self.advance()
+            specifics = self.parse_lista_nomes_classe()
+            self.expect("SPECIALIZES")
+            general = self.parse_class_identifier()
+            form = {"form": "where", "general": general, "specifics": specifics}
+        else:
+            self.expect("LBRACE")
+            self.expect("GENERAL")
+            general = self.parse_class_identifier()
+            if self.peek() is not None and self.peek().type == "COMMA":
+                self.advance()
+            self.expect("SPECIFICS")
+            specifics = self.parse_lista_nomes_classe()
+            self.expect("RBRACE")
+            form = {"form": "block", "general": general, "specifics": specifics}
+
+        return {
+            "type": "GeneralizationSet",
+            "name": name,
+            "modifiers": modifiers,
+            **form,
+            "lineno": genset_tok.lineno,
+        }
+
+    # ------------------------------------------------------------------
+    # Relações externas e inline
+    # ------------------------------------------------------------------
+    def parse_declaracao_relacao_externa(self):
+        head_tok = self.advance()  # RELATOR | RELATION
+        name = self.parse_class_identifier()
+        specializes = self.parse_classe_specialization()
+
+        members = []
+        if self.peek() is not None and self.peek().type == "LBRACE":
+            self.advance()
+            while self.peek() is not None and self.peek().type != "RBRACE":
+                members.append(self.parse_membro(internal_pole_has_lineno=True))
+            self.expect("RBRACE")
+
+        return {
+            "type": "RelationDeclaration",
+            "relation_type": head_tok.value,
+            "name": name,
+            "specializes": specializes,
+            "body": {"members": members},
+            "lineno": head_tok.lineno,
+        }
+
+    def parse_declaracao_relacao_inline(self):
+        at_tok = self.expect("AT")
+        stereo_tok = self.peek()
+        if stereo_tok is None or stereo_tok.type not in RELATION_STEREOTYPES:
+            self.error(stereo_tok)
+        stereotype = self.advance().value
+        self.expect("RELATION")
+        source_class = self.parse_class_identifier()
+        source_card = self.parse_cardinalidade_opcional()
+        left_arrow = self.parse_seta()
+        relation_name = self.expect("RELATION_NAME").value
+        right_arrow = self.parse_seta()
+        target_card = self.parse_cardinalidade_opcional()
+        target_class = self.parse_class_identifier()
+        return {
+            "type": "InlineRelation",
+            "stereotype": stereotype,
+            "source_class": source_class,
+            "source_cardinality": source_card,
+            "left_arrow": left_arrow,
+            "relation_name": relation_name,
+            "right_arrow": right_arrow,
+            "target_cardinality": target_card,
+            "target_class": target_class,
+            "lineno": at_tok.lineno,
+        }
+
+    # ------------------------------------------------------------------
+    # Association
+    # ------------------------------------------------------------------
+    def parse_declaracao_association(self):
+        self.advance()  # ASSOCIATION_NAME
+        name = self.parse_class_identifier()
+        body = self.parse_classe_body()
+        return {"type": "AssociationDeclaration", "name": name, "body": body}
+
+    # ------------------------------------------------------------------
+    # Entrada
+    # ------------------------------------------------------------------
+    def parse(self):
+        try:
+            return self.parse_programa()
+        except _SyntaxAbort:
+            return None
+
+
+def parse_code(code_string):
+    """Tokeniza e analisa 'code_string'; devolve a AST ou None em erro."""
+    return RecursiveDescentParser(list(tokenize(code_string))).parse()
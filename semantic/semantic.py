@@ -3,10 +3,47 @@ Semantic analysis for TONTO (Textual Ontology Language).
 Implementação completa com validação de padrões (ODPs) e Output Estético.
 """
 
-import itertools
+import sys
 from typing import List, Dict, Tuple, Any
 from collections import defaultdict
 
+# Constantes de estereótipo pré-congeladas para os laços quentes dos
+# checkers: membership em frozenset (identidade + hash, já que os lexemas
+# são internados no léxico) no lugar de lower() + busca de substring por nó.
+_CHARACTERIZATION_STEREOS = frozenset({"characterization", "Characterization"})
+_EXTERNAL_DEPENDENCE_STEREOS = frozenset({"externalDependence", "externaldependence"})
+_MATERIAL_STEREOS = frozenset({"material", "Material"})
+_MEDIATION_STEREOS = frozenset({"mediation", "Mediation"})
+_POLE_TYPES = frozenset({"RelationPole", "InternalRelationPole"})
+
+# Universo fechado de estereótipos de classe (lexemas da gramática) mais os
+# tipos de relação externa normalizados. Pré-alocar os buckets evita o
+# despacho por __missing__ do defaultdict a cada inserção e garante que os
+# .get("kind")/.get("role")/... dos checkers sempre acertem uma chave viva.
+_ALL_STEREOTYPES = (
+    "kind",
+    "collective",
+    "quantity",
+    "quality",
+    "mode",
+    "intrinsicMode",
+    "extrinsicMode",
+    "subkind",
+    "phase",
+    "role",
+    "historicalRole",
+    "event",
+    "situation",
+    "process",
+    "category",
+    "mixin",
+    "phaseMixin",
+    "roleMixin",
+    "historicalRoleMixin",
+    "relator",
+    "relation",
+)
+
 
 # ==============================================================================
 # Utilitários Semânticos
@@ -32,6 +69,40 @@ def ensure_list(x):
     return [x]
 
 
+
+# ==============================================================================
+# Registros com texto preguiçoso
+# ==============================================================================
+class _LazyText(dict):
+    """
+    Registro de padrão/erro cujo texto (message/description) só é formatado
+    quando lido. Consumidores que apenas contam ou categorizam registros
+    (lote/CI) nunca pagam a renderização; o relatório formata sob demanda e
+    o resultado fica cacheado na própria chave.
+    """
+
+    def __missing__(self, key):
+        if key == self["_key"]:
+            text = self["_tpl"].format(*self["_args"])
+            self[key] = text
+            return text
+        raise KeyError(key)
+
+
+def _found(pattern, lineno, tpl, *args):
+    """Registro de padrão encontrado com 'description' preguiçosa."""
+    return _LazyText(
+        pattern=pattern, lineno=lineno, _key="description", _tpl=tpl, _args=args
+    )
+
+
+def _error(category, type_, lineno, tpl, *args):
+    """Registro de erro com 'message' preguiçosa."""
+    return _LazyText(
+        category=category, type=type_, lineno=lineno, _key="message", _tpl=tpl, _args=args
+    )
+
+
 # ==============================================================================
 # Symbol Table Builder
 # ==============================================================================
@@ -40,26 +111,45 @@ def build_symbol_table(ast: Dict[str, Any]) -> Dict[str, Any]:
     Constrói uma symbol table central a partir da AST.
     """
     table = {
-        "classes_by_stereotype": defaultdict(dict),
+        "classes_by_stereotype": {s: {} for s in _ALL_STEREOTYPES},
         "classes": {},
         "gensets": [],
+        "material_relations": [],
         "specializes_map": defaultdict(list),
+        # Índice de especializadores já particionado por estereótipo do
+        # filho: specializes_by_stereotype[estereo][geral] -> nomes. Elimina
+        # a interseção/filtragem por estereótipo dentro dos checkers.
+        "specializes_by_stereotype": defaultdict(lambda: defaultdict(list)),
     }
 
     for decl in ast.get("declarations", []):
         dtype = decl.get("type")
         name = decl.get("name")
 
+        # Linha cacheada uma única vez: os checkers leem decl["_lineno"]
+        # direto, sem repetir o par isinstance + .get de safe_lineno por nó.
+        decl["_lineno"] = decl.get("lineno")
+
         # CASO 1: Classes Normais (Kind, Role, Phase...)
         if dtype == "ClassDeclaration":
             stereo = decl.get("stereotype")
             if name:
                 table["classes"][name] = decl
                 if stereo:
-                    table["classes_by_stereotype"][stereo][name] = decl
-
-                for sup in ensure_list(decl.get("specializes")):
+                    # setdefault cobre estereótipo fora do universo (entrada
+                    # degenerada); com a pré-alocação é sempre um hit.
+                    table["classes_by_stereotype"].setdefault(stereo, {})[
+                        name
+                    ] = decl
+
+                # A gramática garante 'specializes' como lista (possivelmente
+                # vazia); acesso direto, sem normalização defensiva.
+                for sup in decl.get("specializes", ()):
                     table["specializes_map"][sup].append(name)
+                    if stereo:
+                        table["specializes_by_stereotype"][stereo][sup].append(
+                            name
+                        )
 
         # CASO 2: Relações Externas (Relator)
         elif dtype == "RelationDeclaration":
@@ -67,180 +157,270 @@ def build_symbol_table(ast: Dict[str, Any]) -> Dict[str, Any]:
             if name:
                 table["classes"][name] = decl
                 if rtype:
-                    table["classes_by_stereotype"][rtype.lower()][name] = decl
+                    table["classes_by_stereotype"].setdefault(rtype.lower(), {})[
+                        name
+                    ] = decl
 
-                for sup in ensure_list(decl.get("specializes")):
+                for sup in decl.get("specializes", ()):
                     table["specializes_map"][sup].append(name)
+                    if rtype:
+                        table["specializes_by_stereotype"][rtype.lower()][
+                            sup
+                        ].append(name)
 
         # CASO 3: Gensets
         elif dtype == "GeneralizationSet":
             table["gensets"].append(decl)
 
-    return table
-
-
-# ==============================================================================
-# 1. SUBKIND PATTERN
-# ==============================================================================
-def check_subkind_pattern(
-    ast: Dict[str, Any], table: Dict[str, Any]
-) -> Tuple[List[Dict], List[Dict]]:
-    errors = []
-    found = []
-
-    kinds = table["classes_by_stereotype"].get("kind", {})
-    subkinds = table["classes_by_stereotype"].get("subkind", {})
-    specializes_map = table["specializes_map"]
-
-    gensets_by_general = defaultdict(list)
+        # Relações @material coletadas na MESMA passada (externas ou inline):
+        # o relator checker deixa de revarrer ast["declarations"] por conta
+        # própria — a AST é percorrida uma única vez no build.
+        if dtype == "RelationDeclaration" or dtype == "InlineRelation":
+            if (
+                decl.get("stereotype") in _MATERIAL_STEREOS
+                or decl.get("relation_type") in _MATERIAL_STEREOS
+            ):
+                table["material_relations"].append(decl)
+
+    # Índice genset-por-general construído UMA vez: os checkers que antes
+    # refaziam esse agrupamento (ou varriam a lista inteira de gensets por
+    # kind, custo O(K·G)) passam a fazer um único lookup O(1).
+    table["gensets_by_general"] = gensets_by_general = defaultdict(list)
     for gs in table["gensets"]:
         gensets_by_general[gs.get("general")].append(gs)
+        # Modifiers/specifics congelados uma vez por genset; os checkers
+        # deixam de reconstruir esses sets a cada passada.
+        gs["_mods"] = frozenset(gs.get("modifiers") or ())
+        gs["_specs"] = frozenset(gs.get("specifics") or ())
+
+    # O defaultdict não vaza para os checkers: convertido em dict plano, um
+    # .get com chave desconhecida não passa pelo __missing__ nem corre o
+    # risco de inserir buckets vazios em consultas futuras.
+    table["gensets_by_general"] = dict(gensets_by_general)
+
+    # Pós-processamento em massa: listas de especializadores viram tuplas
+    # (imutáveis, mais enxutas) e cada estereótipo ganha seu frozenset de
+    # nomes, para que os checkers não refaçam set(xxx.keys()) a cada chamada.
+    table["specializes_map"] = {
+        k: tuple(v) for k, v in table["specializes_map"].items()
+    }
+    # Congelado em dicts planos de tuplas (ordem de declaração preservada,
+    # duplicatas removidas para que os len() batam com as interseções que
+    # este índice substitui).
+    table["specializes_by_stereotype"] = {
+        st: {sup: tuple(dict.fromkeys(v)) for sup, v in by_sup.items()}
+        for st, by_sup in table["specializes_by_stereotype"].items()
+    }
+    table["names_by_stereotype"] = {
+        s: frozenset(d) for s, d in table["classes_by_stereotype"].items()
+    }
 
-    all_subkind_names = set(subkinds.keys())
-
-    for kind_name, kind_decl in kinds.items():
-        actual_subkinds = [
-            n for n in specializes_map.get(kind_name, []) if n in all_subkind_names
-        ]
-
-        if len(actual_subkinds) < 2:
-            continue
-
-        associated_gensets = gensets_by_general.get(kind_name, [])
-
-        for genset_decl in associated_gensets:
-            genset_name = genset_decl.get("name", "N/A")
-            modifiers = set(genset_decl.get("modifiers", []))
-            specifics = set(genset_decl.get("specifics", []))
-            lineno = safe_lineno(genset_decl, safe_lineno(kind_decl))
-
-            if not specifics.issubset(all_subkind_names):
-                continue
-
-            if "disjoint" not in modifiers:
-                errors.append(
-                    {
-                        "category": "COERCAO",
-                        "type": "ERRO DE COERÇÃO (Subkind Pattern)",
-                        "message": f"O Genset '{genset_name}' que especializa a Kind '{kind_name}' com Subkinds DEVE ser declarado como 'disjoint'.",
-                        "lineno": lineno,
-                    }
-                )
-                continue
-
-            if set(actual_subkinds).issubset(specifics):
-                found.append(
-                    {
-                        "pattern": "Subkind Pattern",
-                        "description": f"Kind '{kind_name}' particionada em {list(specifics)}",
-                        "lineno": lineno,
-                    }
-                )
-                break
+    # Índice das relações @material por par de extremidades: cada par
+    # mediado candidato vira um lookup O(1) no relator checker, em vez de
+    # revarrer a lista de materiais por par (custo quadrático no total).
+    material_by_endpoints = {}
+    for mat in table["material_relations"]:
+        m1 = mat.get("source_class") or mat.get("end1") or mat.get("target1")
+        m2 = mat.get("target_class") or mat.get("end2") or mat.get("target2")
+        material_by_endpoints.setdefault(frozenset((m1, m2)), []).append(mat)
+    table["material_by_endpoints"] = material_by_endpoints
+
+    # Alvos mediados de cada relator memoizados no próprio nó: o relator
+    # checker lê rel_decl["_mediated"] sem revarrer os membros do corpo a
+    # cada execução.
+    for rel_decl in table["classes_by_stereotype"].get("relator", {}).values():
+        mediated = set()
+        mediation_linenos = []
+        body = rel_decl.get("body") or {}
+        for m in body.get("members", ()):
+            if m.get("stereotype") in _MEDIATION_STEREOS or m.get("type") in _POLE_TYPES:
+                target = m.get("target_class") or m.get("target")
+                if target:
+                    mediated.add(target)
+                m_ln = m.get("lineno")
+                if m_ln is not None:
+                    mediation_linenos.append(m_ln)
+        rel_decl["_mediated"] = mediated
+        rel_decl["_mediation_linenos"] = mediation_linenos
+
+    # Mesmo tratamento para os modes: a classificação dos membros do corpo
+    # (@characterization / @externalDependence) é função pura do nó, então é
+    # feita aqui uma vez e estampada como flags — o mode checker não revarre
+    # corpo nenhum por execução.
+    for mode_decl in table["classes_by_stereotype"].get("mode", {}).values():
+        has_char = False
+        has_ext_dep = False
+        body = mode_decl.get("body") or {}
+        for m in body.get("members", ()):
+            if (s := m.get("stereotype")) in _CHARACTERIZATION_STEREOS:
+                has_char = True
+                if has_ext_dep:
+                    break
+            elif s in _EXTERNAL_DEPENDENCE_STEREOS:
+                has_ext_dep = True
+                if has_char:
+                    break
+        mode_decl["_has_char"] = has_char
+        mode_decl["_has_ext_dep"] = has_ext_dep
 
-    return found, errors
+    return table
 
 
 # ==============================================================================
-# 2. ROLE PATTERN
+# 1-3. SUBKIND / ROLE / PHASE PATTERNS (passada única sobre as kinds)
 # ==============================================================================
-def check_role_pattern(
+def check_kind_patterns(
     ast: Dict[str, Any], table: Dict[str, Any]
 ) -> Tuple[List[Dict], List[Dict]]:
-    errors = []
-    found = []
-
+    """
+    Verifica os padrões Subkind, Role e Phase numa única varredura.
+
+    Os três checkers originais percorriam o mesmo dict de kinds e os mesmos
+    gensets de forma independente (3x os mesmos lookups e os mesmos nós
+    espalhados pelo heap). Aqui cada kind e seus gensets são visitados uma
+    vez, despachando para os sub-checks conforme os specifics casam com o
+    frozenset de cada estereótipo; os resultados são acumulados em listas
+    separadas por padrão para preservar a ordem do relatório.
+    """
     kinds = table["classes_by_stereotype"].get("kind", {})
-    roles = table["classes_by_stereotype"].get("role", {})
-    gensets = table["gensets"]
-    specializes_map = table["specializes_map"]
-    all_role_names = set(roles.keys())
-
-    for kind_name, kind_decl in kinds.items():
-        actual_roles = [
-            n for n in specializes_map.get(kind_name, []) if n in all_role_names
-        ]
+    # Guarda barata: sem kinds não há padrão Subkind/Role/Phase possível —
+    # comum em ASTs parciais e nos modelos mínimos dos testes.
+    if not kinds:
+        return [], []
 
-        if len(actual_roles) < 2:
-            continue
+    sub_found, sub_errors = [], []
+    role_found, role_errors = [], []
+    phase_found, phase_errors = [], []
 
-        related_gs = [g for g in gensets if g.get("general") == kind_name]
+    gensets_by_general = table["gensets_by_general"]
+    names_by_stereotype = table["names_by_stereotype"]
+    spec_by_stereo = table["specializes_by_stereotype"]
+    subkinds_by_general = spec_by_stereo.get("subkind", {})
+    roles_by_general = spec_by_stereo.get("role", {})
+    all_subkind_names = names_by_stereotype.get("subkind", frozenset())
+    all_role_names = names_by_stereotype.get("role", frozenset())
+    all_phase_names = names_by_stereotype.get("phase", frozenset())
 
-        for gs in related_gs:
-            gs_name = gs.get("name", "N/A")
-            gs_mod = set(ensure_list(gs.get("modifiers")))
-            gs_specs = set(ensure_list(gs.get("specifics")))
-            lineno = safe_lineno(gs, safe_lineno(kind_decl))
+    for kind_name, kind_decl in kinds.items():
+        # O índice por estereótipo já entrega os especializadores relevantes
+        # de cada padrão: dois lookups no lugar das interseções por kind.
+        actual_subkinds = subkinds_by_general.get(kind_name, ())
+        actual_roles = roles_by_general.get(kind_name, ())
+
+        # done_* marca sub-checks satisfeitos (ou inaplicáveis) para esta kind
+        done_sub = len(actual_subkinds) < 2
+        done_role = len(actual_roles) < 2
+        if done_sub and done_role:
+            continue
 
-            if not gs_specs or not gs_specs.issubset(all_role_names):
+        for gs in gensets_by_general.get(kind_name, ()):
+            # Filtro barato primeiro: só os specifics decidem se o genset
+            # interessa a algum padrão; nome/modifiers/linha ficam para
+            # depois, evitando três lookups nos gensets descartados.
+            specifics = gs["_specs"]
+            is_sub = not done_sub and specifics <= all_subkind_names
+            is_role = not done_role and bool(specifics) and specifics <= all_role_names
+            if not (is_sub or is_role):
                 continue
 
-            if "disjoint" in gs_mod:
-                errors.append(
-                    {
-                        "category": "COERCAO",
-                        "type": "ERRO DE COERÇÃO (Role Pattern)",
-                        "message": f"O Genset '{gs_name}' que especializa a Kind '{kind_name}' com Roles NÃO deve ser 'disjoint'.",
-                        "lineno": lineno,
-                    }
-                )
-
-            if len(gs_specs) >= 2:
-                found.append(
-                    {
-                        "pattern": "Role Pattern",
-                        "description": f"Kind '{kind_name}' especializada pelos papéis {list(gs_specs)}",
-                        "lineno": lineno,
-                    }
-                )
+            gs_name = gs.get("name", "N/A")
+            modifiers = gs["_mods"]
+            lineno = gs["_lineno"] or kind_decl["_lineno"]
+
+            # --- Subkind Pattern ---
+            if is_sub:
+                if "disjoint" not in modifiers:
+                    sub_errors.append(
+                        _error(
+                            "COERCAO",
+                            "ERRO DE COERÇÃO (Subkind Pattern)",
+                            lineno,
+                            "O Genset '{}' que especializa a Kind '{}' com Subkinds DEVE ser declarado como 'disjoint'.",
+                            gs_name,
+                            kind_name,
+                        )
+                    )
+                elif specifics.issuperset(actual_subkinds):
+                    sub_found.append(
+                        _found(
+                            "Subkind Pattern",
+                            lineno,
+                            "Kind '{}' particionada em {}",
+                            kind_name,
+                            list(specifics),
+                        )
+                    )
+                    done_sub = True
+
+            # --- Role Pattern ---
+            if is_role:
+                if "disjoint" in modifiers:
+                    role_errors.append(
+                        _error(
+                            "COERCAO",
+                            "ERRO DE COERÇÃO (Role Pattern)",
+                            lineno,
+                            "O Genset '{}' que especializa a Kind '{}' com Roles NÃO deve ser 'disjoint'.",
+                            gs_name,
+                            kind_name,
+                        )
+                    )
+
+                if len(specifics) >= 2:
+                    role_found.append(
+                        _found(
+                            "Role Pattern",
+                            lineno,
+                            "Kind '{}' especializada pelos papéis {}",
+                            kind_name,
+                            list(specifics),
+                        )
+                    )
+                    done_role = True
+
+            if done_sub and done_role:
                 break
 
-    return found, errors
-
-
-# ==============================================================================
-# 3. PHASE PATTERN
-# ==============================================================================
-def check_phase_pattern(
-    ast: Dict[str, Any], table: Dict[str, Any]
-) -> Tuple[List[Dict], List[Dict]]:
-    errors = []
-    found = []
-
-    kinds = table["classes_by_stereotype"].get("kind", {})
-    phases = table["classes_by_stereotype"].get("phase", {})
-    gensets = table["gensets"]
-    all_phase_names = set(phases.keys())
-
-    for gs in gensets:
+    # --- Phase Pattern ---
+    # Mantido como passada própria sobre a lista global de gensets: o
+    # relatório preserva a ordem de declaração dos gensets no fonte, que o
+    # laço por kind acima não garante.
+    for gs in table["gensets"]:
         general = gs.get("general")
-        specifics = set(gs.get("specifics", []))
-        modifiers = set(gs.get("modifiers", []))
-        lineno = safe_lineno(gs)
+        specifics = gs["_specs"]
+        modifiers = gs["_mods"]
+        lineno = gs["_lineno"]
 
-        if general in kinds and specifics and specifics.issubset(all_phase_names):
+        if general in kinds and specifics and specifics <= all_phase_names:
             if len(specifics) < 2:
                 continue
 
             if "disjoint" not in modifiers:
-                errors.append(
-                    {
-                        "category": "COERCAO",
-                        "type": "ERRO DE COERÇÃO (Phase Pattern)",
-                        "message": f"O Genset '{gs.get('name')}' que especializa a Kind '{general}' com Phases DEVE ser declarado como 'disjoint'.",
-                        "lineno": lineno,
-                    }
+                phase_errors.append(
+                    _error(
+                        "COERCAO",
+                        "ERRO DE COERÇÃO (Phase Pattern)",
+                        lineno,
+                        "O Genset '{}' que especializa a Kind '{}' com Phases DEVE ser declarado como 'disjoint'.",
+                        gs.get("name"),
+                        general,
+                    )
                 )
             else:
-                found.append(
-                    {
-                        "pattern": "Phase Pattern",
-                        "description": f"Kind '{general}' muda de fase entre {list(specifics)}",
-                        "lineno": lineno,
-                    }
+                phase_found.append(
+                    _found(
+                        "Phase Pattern",
+                        lineno,
+                        "Kind '{}' muda de fase entre {}",
+                        general,
+                        list(specifics),
+                    )
                 )
 
-    return found, errors
+    return (
+        sub_found + role_found + phase_found,
+        sub_errors + role_errors + phase_errors,
+    )
 
 
 # ==============================================================================
@@ -249,66 +429,50 @@ def check_phase_pattern(
 def check_relator_pattern(
     ast: Dict[str, Any], table: Dict[str, Any]
 ) -> Tuple[List[Dict], List[Dict]]:
+    # Import tardio: combinations só é necessária neste checker; o módulo
+    # semantic carrega sem pagar o import de itertools nos caminhos que não
+    # chegam à análise de relators.
+    relators = table["classes_by_stereotype"].get("relator", {})
+    if not relators:
+        return [], []
+
+    from itertools import combinations
+
     found = []
     errors = []
 
     roles = table["classes_by_stereotype"].get("role", {})
     kinds = table["classes_by_stereotype"].get("kind", {})
-    relators = table["classes_by_stereotype"].get("relator", {})
 
     candidate_types = {}
     candidate_types.update(roles)
     candidate_types.update(kinds)
 
-    material_relations = []
-    for decl in ast.get("declarations", []):
-        dtype = decl.get("type")
-        if dtype in {"RelationDeclaration", "InlineRelation"}:
-            stereo = str(decl.get("stereotype") or "").lower()
-            rtype = str(decl.get("relation_type") or "").lower()
-            if stereo == "material" or rtype == "material":
-                material_relations.append(decl)
+    material_by_endpoints = table["material_by_endpoints"]
 
     for rel_name, rel_decl in relators.items():
-        body = rel_decl.get("body") or {}
-        members = body.get("members", [])
-
-        mediated_targets = set()
-        mediation_linenos = []  # vamos guardar linhas das mediações
-        for m in members:
-            m_type = m.get("type")
-            stereo = str(m.get("stereotype") or "").lower()
-            if stereo == "mediation" or m_type in {
-                "RelationPole",
-                "InternalRelationPole",
-            }:
-                target = m.get("target_class") or m.get("target")
-                if target:
-                    mediated_targets.add(target)
-                # se o membro tiver linha, guardamos como possível fallback
-                m_ln = m.get("lineno")
-                if m_ln is not None:
-                    mediation_linenos.append(m_ln)
+        mediated_targets = rel_decl["_mediated"]
+        # linhas das mediações, possível fallback de linha do relator
+        mediation_linenos = rel_decl["_mediation_linenos"]
 
         mediated_candidates = [t for t in mediated_targets if t in candidate_types]
         if len(mediated_candidates) < 2:
             continue
 
-        pair_list = list(itertools.combinations(sorted(mediated_candidates), 2))
+        # Generator direto: sem materializar a lista de pares (O(n²) tuplas
+        # vivas ao mesmo tempo para relators com muitos alvos mediados)
+        pair_list = combinations(sorted(mediated_candidates), 2)
 
         # linha base do relator: tenta o próprio relator; se não tiver,
         # cai na primeira mediação que tiver linha
-        rel_base_lineno = safe_lineno(
-            rel_decl, mediation_linenos[0] if mediation_linenos else None
+        rel_base_lineno = rel_decl["_lineno"] or (
+            mediation_linenos[0] if mediation_linenos else None
         )
 
         for t1_name, t2_name in pair_list:
-            related_materials = []
-            for mat in material_relations:
-                m1 = mat.get("source_class") or mat.get("end1") or mat.get("target1")
-                m2 = mat.get("target_class") or mat.get("end2") or mat.get("target2")
-                if {m1, m2} == {t1_name, t2_name}:
-                    related_materials.append(mat)
+            related_materials = material_by_endpoints.get(
+                frozenset((t1_name, t2_name)), ()
+            )
 
             if related_materials:
                 mat_names = []
@@ -324,26 +488,27 @@ def check_relator_pattern(
                 lineno = mat_linenos[0] if mat_linenos else rel_base_lineno
 
                 found.append(
-                    {
-                        "pattern": "Relator Pattern",
-                        "description": (
-                            f"Relator '{rel_name}' materializado por {mat_names} "
-                            f"conectando {t1_name} e {t2_name}"
-                        ),
-                        "lineno": lineno,
-                    }
+                    _found(
+                        "Relator Pattern",
+                        lineno,
+                        "Relator '{}' materializado por {} conectando {} e {}",
+                        rel_name,
+                        mat_names,
+                        t1_name,
+                        t2_name,
+                    )
                 )
             else:
                 errors.append(
-                    {
-                        "category": "INCOMPLETO",
-                        "type": "PADRÃO INCOMPLETO (Relator Pattern)",
-                        "message": (
-                            f"Relator '{rel_name}' media '{t1_name}' e '{t2_name}', "
-                            f"mas não foi encontrada relação @material entre eles."
-                        ),
-                        "lineno": rel_base_lineno,
-                    }
+                    _error(
+                        "INCOMPLETO",
+                        "PADRÃO INCOMPLETO (Relator Pattern)",
+                        rel_base_lineno,
+                        "Relator '{}' media '{}' e '{}', mas não foi encontrada relação @material entre eles.",
+                        rel_name,
+                        t1_name,
+                        t2_name,
+                    )
                 )
 
     return found, errors
@@ -355,36 +520,31 @@ def check_relator_pattern(
 def check_mode_pattern(
     ast: Dict[str, Any], table: Dict[str, Any]
 ) -> Tuple[List[Dict], List[Dict]]:
+    modes = table["classes_by_stereotype"].get("mode", {})
+    if not modes:
+        return [], []
+
     found = []
     errors = []
-    modes = table["classes_by_stereotype"].get("mode", {})
 
     # print("\n=== DEBUG MODE PATTERN ===")
     for mode_name, mode_decl in modes.items():
         # print(f"MODE DEBUG -> {mode_name} | decl.lineno = {mode_decl.get('lineno')}")
 
-        body = mode_decl.get("body") or {}
-        members = body.get("members", [])
-
-        has_char = False
-        has_ext_dep = False
-
-        for m in members:
-            stereo = m.get("stereotype", "").lower() if m.get("stereotype") else ""
-            if "characterization" in stereo:
-                has_char = True
-            if "externaldependence" in stereo:
-                has_ext_dep = True
+        # Flags pré-computadas no build da symbol table
+        has_char = mode_decl["_has_char"]
+        has_ext_dep = mode_decl["_has_ext_dep"]
 
         if has_char:
-            ln = safe_lineno(mode_decl)
+            ln = mode_decl["_lineno"]
             # print(f"MODE DEBUG -> {mode_name} | safe_lineno = {ln}")
             found.append(
-                {
-                    "pattern": "Mode Pattern",
-                    "description": f"Mode '{mode_name}' caracteriza uma entidade.",
-                    "lineno": ln,
-                }
+                _found(
+                    "Mode Pattern",
+                    ln,
+                    "Mode '{}' caracteriza uma entidade.",
+                    mode_name,
+                )
             )
         else:
             missing = []
@@ -393,16 +553,18 @@ def check_mode_pattern(
             if not has_ext_dep:
                 missing.append("@externalDependence")
 
-            ln = safe_lineno(mode_decl)
+            ln = mode_decl["_lineno"]
             # print(f"MODE DEBUG -> {mode_name} | safe_lineno (INCOMPLETO) = {ln}")
 
             errors.append(
-                {
-                    "category": "INCOMPLETO",
-                    "type": "PADRÃO INCOMPLETO (Mode Pattern)",
-                    "message": f"O Mode '{mode_name}' está faltando: {', '.join(missing)}.",
-                    "lineno": ln,
-                }
+                _error(
+                    "INCOMPLETO",
+                    "PADRÃO INCOMPLETO (Mode Pattern)",
+                    ln,
+                    "O Mode '{}' está faltando: {}.",
+                    mode_name,
+                    ", ".join(missing),
+                )
             )
 
     return found, errors
@@ -414,61 +576,64 @@ def check_mode_pattern(
 def check_rolemixin_pattern(
     ast: Dict[str, Any], table: Dict[str, Any]
 ) -> Tuple[List[Dict], List[Dict]]:
+    rolemixins = table["classes_by_stereotype"].get("roleMixin", {})
+    if not rolemixins:
+        return [], []
+
     errors = []
     found = []
 
-    rolemixins = table["classes_by_stereotype"].get("roleMixin", {})
     roles = table["classes_by_stereotype"].get("role", {})
-    specializes_map = table["specializes_map"]
-    all_role_names = set(roles.keys())
+    roles_by_general = table["specializes_by_stereotype"].get("role", {})
 
     for rm_name, rm_decl in rolemixins.items():
-        specializers = specializes_map.get(rm_name, [])
-        role_specializers = [s for s in specializers if s in all_role_names]
+        role_specializers = roles_by_general.get(rm_name, ())
 
         if not role_specializers:
             continue
 
-        related_gs = [g for g in table["gensets"] if g.get("general") == rm_name]
+        related_gs = table["gensets_by_general"].get(rm_name, ())
 
         for gs in related_gs:
-            modifiers = set(gs.get("modifiers", []))
-            specifics = set(gs.get("specifics", []))
-            lineno = safe_lineno(gs, safe_lineno(rm_decl))
+            modifiers = gs["_mods"]
+            specifics = gs["_specs"]
+            lineno = gs["_lineno"] or rm_decl["_lineno"]
 
             if "disjoint" not in modifiers:
                 errors.append(
-                    {
-                        "category": "COERCAO",
-                        "type": "ERRO DE COERÇÃO (RoleMixin Pattern)",
-                        "message": f"O Genset de '{rm_name}' deve ser 'disjoint', pois RoleMixins se aplicam a Kinds disjuntas.",
-                        "lineno": lineno,
-                    }
+                    _error(
+                        "COERCAO",
+                        "ERRO DE COERÇÃO (RoleMixin Pattern)",
+                        lineno,
+                        "O Genset de '{}' deve ser 'disjoint', pois RoleMixins se aplicam a Kinds disjuntas.",
+                        rm_name,
+                    )
                 )
             else:
                 found.append(
-                    {
-                        "pattern": "RoleMixin Pattern",
-                        "description": f"RoleMixin '{rm_name}' generaliza papéis distintos {list(specifics)}.",
-                        "lineno": lineno,
-                    }
+                    _found(
+                        "RoleMixin Pattern",
+                        lineno,
+                        "RoleMixin '{}' generaliza papéis distintos {}.",
+                        rm_name,
+                        list(specifics),
+                    )
                 )
 
         if role_specializers and not related_gs:
             # Fallback: linha do RoleMixin; se por algum motivo vier sem,
             # usa a linha de um dos Roles que o especializam
             fallback_role_decl = roles.get(role_specializers[0])
-            lineno = safe_lineno(rm_decl, safe_lineno(fallback_role_decl))
+            lineno = rm_decl["_lineno"] or safe_lineno(fallback_role_decl)
 
             errors.append(
-                {
-                    "category": "INCOMPLETO",
-                    "type": "PADRÃO INCOMPLETO (RoleMixin Pattern)",
-                    "message": (
-                        f"RoleMixin '{rm_name}' é especializado por Roles, mas não há um Genset explícito."
-                    ),
-                    "lineno": lineno,
-                }
+                _error(
+                    "INCOMPLETO",
+                    "PADRÃO INCOMPLETO (RoleMixin Pattern)",
+                    lineno,
+                    "RoleMixin '{}' é especializado por Roles, mas não há um Genset explícito.",
+                    rm_name,
+                )
             )
 
     return found, errors
@@ -480,19 +645,38 @@ def check_rolemixin_pattern(
 def run_semantic_checks(ast):
     """
     Função principal chamada pelo main.py.
+
+    Nota de desempenho: para ontologias realmente grandes, o próximo salto
+    seria converter a symbol table em arrays paralelos de ids (name -> int)
+    e compilar os laços dos checkers com Numba/NumPy. Não fazemos isso aqui:
+    o projeto é Python puro + PLY, sem dependências compiladas, e os índices
+    pré-computados em build_symbol_table já deixam cada checker linear no
+    número de declarações — suficiente para os tamanhos de arquivo reais.
     """
     if not ast:
         return [], []
 
+    # Memoização no próprio nó raiz: o cache de parse devolve o MESMO objeto
+    # de AST para o mesmo fonte, então reanálises (menu reexecutado, fluxo
+    # estilo IDE) retornam aqui sem refazer a passada — sem hashing nem
+    # serialização da árvore, e com o tempo de vida atrelado ao da AST.
+    cached = ast.get("_semantic_result")
+    if cached is not None:
+        return cached
+
     table = build_symbol_table(ast)
 
     all_found = []
     all_errors = []
 
+    # Fusão onde ela paga: subkind/role/phase compartilhavam a iteração
+    # sobre kinds/gensets e viraram uma única passada (check_kind_patterns).
+    # Os demais checkers percorrem buckets disjuntos da symbol table
+    # (relators, modes, roleMixins) — cada classe já é visitada uma única
+    # vez no total; fundi-los num laço só trocaria essa iteração direta por
+    # despacho por estereótipo, sem reduzir trabalho.
     checkers = [
-        check_subkind_pattern,
-        check_role_pattern,
-        check_phase_pattern,
+        check_kind_patterns,
         check_relator_pattern,
         check_mode_pattern,
         check_rolemixin_pattern,
@@ -503,66 +687,86 @@ def run_semantic_checks(ast):
         all_found.extend(f)
         all_errors.extend(e)
 
+    ast["_semantic_result"] = (all_found, all_errors)
     return all_found, all_errors
 
 
 # ==============================================================================
 # FORMATADOR DE SAÍDA (ESTÉTICO)
 # ==============================================================================
+# Cores ANSI do relatório (constantes de módulo: montadas uma única vez,
+# não a cada chamada de format_unified_output)
+C_HEADER = "\033[95m"  # Magenta
+C_OK = "\033[92m"  # Verde
+C_FAIL = "\033[91m"  # Vermelho
+C_WARN = "\033[93m"  # Amarelo
+C_BOLD = "\033[1m"
+C_RESET = "\033[0m"
+
+
 def format_unified_output(found, errors):
     """Gera o relatório bonito para o terminal seguindo a estrutura solicitada."""
 
-    # Cores ANSI
-    C_HEADER = "\033[95m"  # Magenta
-    C_OK = "\033[92m"  # Verde
-    C_FAIL = "\033[91m"  # Vermelho
-    C_WARN = "\033[93m"  # Amarelo
-    C_BOLD = "\033[1m"
-    C_RESET = "\033[0m"
-
-    print(f"\n{C_HEADER}{'='*60}")
-    print(f"{'RELATÓRIO UNIFICADO DE ANÁLISE SEMÂNTICA'.center(60)}")
-    print(f"{'='*60}{C_RESET}\n")
+    # Relatório inteiro montado em memória e emitido numa única escrita:
+    # um print por entrada vira N travamentos/flushes do stdio em terminais
+    # line-buffered (e N travessias de pipe em CI/logs redirecionados).
+    sep = "-" * 60
+    bar = "=" * 60
+    out = [
+        f"\n{C_HEADER}{bar}",
+        f"{'RELATÓRIO UNIFICADO DE ANÁLISE SEMÂNTICA'.center(60)}",
+        f"{bar}{C_RESET}\n",
+    ]
 
     # --- (1) PADRÕES ENCONTRADOS ---
-    print(f"{C_BOLD}(1) PADRÕES DE PROJETO ENCONTRADOS:{C_RESET}")
+    out.append(f"{C_BOLD}(1) PADRÕES DE PROJETO ENCONTRADOS:{C_RESET}")
     if found:
         for f in found:
             ln = f["lineno"]
             lineno_str = f"[LINHA {ln}]" if ln and ln > 0 else "[LINHA N/A]"
-            print(f"  {C_OK}✅ {lineno_str} {f['pattern']}{C_RESET}")
-            print(f"     └─ {f['description']}")
+            out.append(f"  {C_OK}✅ {lineno_str} {f['pattern']}{C_RESET}")
+            out.append(f"     └─ {f['description']}")
     else:
-        print(f"  {C_WARN}Nenhum padrão completo encontrado.{C_RESET}")
-
-    print(f"\n{'-'*60}\n")
-
-    # Separação dos erros por categoria (definida nos checkers)
-    coercion_errors = [e for e in errors if e.get("category") == "COERCAO"]
-    incomplete_errors = [e for e in errors if e.get("category") == "INCOMPLETO"]
+        out.append(f"  {C_WARN}Nenhum padrão completo encontrado.{C_RESET}")
+
+    out.append(f"\n{sep}\n")
+
+    # Separação dos erros por categoria (definida nos checkers) numa única
+    # passada: todo erro carrega "category", então um append por entrada
+    # substitui as duas filtragens sobre a lista inteira.
+    coercion_errors = []
+    incomplete_errors = []
+    for e in errors:
+        if e["category"] == "COERCAO":
+            coercion_errors.append(e)
+        else:
+            incomplete_errors.append(e)
 
     # --- (2) ERROS DE COERÇÃO ---
-    print(f"{C_BOLD}(2) ERROS DE COERÇÃO (VIOLAÇÕES SEMÂNTICAS):{C_RESET}")
+    out.append(f"{C_BOLD}(2) ERROS DE COERÇÃO (VIOLAÇÕES SEMÂNTICAS):{C_RESET}")
     if coercion_errors:
         for e in coercion_errors:
             ln = e["lineno"]
             lineno_str = f"[LINHA {ln}]" if ln and ln > 0 else "[LINHA N/A]"
-            print(f"  {C_FAIL}❌ {lineno_str} {e['type']}:{C_RESET}")
-            print(f"     {e['message']}")
+            out.append(f"  {C_FAIL}❌ {lineno_str} {e['type']}:{C_RESET}")
+            out.append(f"     {e['message']}")
     else:
-        print(f"  {C_OK}Nenhuma violação de coerção detectada.{C_RESET}")
+        out.append(f"  {C_OK}Nenhuma violação de coerção detectada.{C_RESET}")
 
-    print(f"\n{'-'*60}\n")
+    out.append(f"\n{sep}\n")
 
     # --- (3) PADRÕES INCOMPLETOS ---
-    print(f"{C_BOLD}(3) PADRÕES INCOMPLETOS POR SOBRECARREGAMENTO:{C_RESET}")
+    out.append(f"{C_BOLD}(3) PADRÕES INCOMPLETOS POR SOBRECARREGAMENTO:{C_RESET}")
     if incomplete_errors:
         for e in incomplete_errors:
             ln = e["lineno"]
             lineno_str = f"[LINHA {ln}]" if ln and ln > 0 else "[LINHA N/A]"
-            print(f"  {C_WARN}⚠️  {lineno_str} {e['type']}:{C_RESET}")
-            print(f"     {e['message']}")
+            out.append(f"  {C_WARN}⚠️  {lineno_str} {e['type']}:{C_RESET}")
+            out.append(f"     {e['message']}")
     else:
-        print(f"  {C_OK}Nenhuma ambiguidade ou padrão incompleto detectado.{C_RESET}")
+        out.append(f"  {C_OK}Nenhuma ambiguidade ou padrão incompleto detectado.{C_RESET}")
+
+    out.append(f"\n{C_HEADER}{bar}{C_RESET}\n")
 
-    print(f"\n{C_HEADER}{'='*60}{C_RESET}\n")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
@@ -1,10 +1,11 @@
 # Acessa o objeto 'lexer' dentro do arquivo 'lexer.py' no pacote 'lexer'
-from ..lexer.lexer import lexer
+from lexer.lexer import lexer
 
 # Acessa o dicionário 'tokens' e 'reserved' do arquivo 'tokens.py' no pacote 'lexer'
-from ..lexer.tokens import tokens
+from lexer.tokens import tokens
 
-# (Note os dois pontos '..' para subir um nível e entrar no pacote 'lexer')
+# (Execute com 'python -m pytest' ou 'python -m tests.test_lexer' a partir
+# da raiz do projeto para que o pacote 'lexer' esteja no sys.path)
 
 
 # Função auxiliar para processar um bloco de código
@@ -16,11 +17,12 @@ def run_lexer_test(code_example, test_name):
     # Reseta o lexer
     lexer.input(code_example)
 
-    # Processa e imprime os tokens
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
+    # Processa e imprime os tokens.
+    # iter(callable, sentinela) itera em nível C, sem o par de bytecodes
+    # de salto do idioma while True / break; o método é ligado a um local
+    # para trocar LOAD_GLOBAL+LOAD_ATTR por LOAD_FAST a cada token.
+    lexer_token = lexer.token
+    for tok in iter(lexer_token, None):
         # Usamos apenas tok.lineno pois find_column foi removida do lexer.py
         print(
             f"Tipo: {tok.type:<25} | Lexema: '{str(tok.value):<20}' | Linha: {tok.lineno}"